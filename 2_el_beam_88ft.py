@@ -18,8 +18,10 @@ from antenna_model import (
     AntennaModel,
     AntennaSimulator,
     plot_polar_patterns,
+    plot_polar_pattern_stream,
     Report,
-    build_dipole_model
+    build_dipole_model,
+    forward_back_gain,
 )
 
 def build_two_element_beam_88ft(
@@ -105,15 +107,9 @@ def main():
         else:
             model = build_two_element_beam_88ft(detune, segments=segments, radius=radius)
         # Impedance at 7.1 MHz
-        R7, X7 = sim.simulate_pattern(
-            model, freq_mhz=7.1, height_m=height_m, ground=ground,
-            el_step=45.0, az_step=360.0
-        )['impedance']
+        R7, X7 = sim.simulate_impedance(model, freq_mhz=7.1, height_m=height_m, ground=ground)
         # Impedance at 3.5 MHz
-        R3, X3 = sim.simulate_pattern(
-            model, freq_mhz=3.5, height_m=height_m, ground=ground,
-            el_step=45.0, az_step=360.0
-        )['impedance']
+        R3, X3 = sim.simulate_impedance(model, freq_mhz=3.5, height_m=height_m, ground=ground)
         # Series compensation for 7.1
         if X7 > 0:
             C7 = 1/(2*math.pi*7.1e6*X7)
@@ -154,19 +150,17 @@ def main():
             else:
                 model = build_two_element_beam_88ft(detune, segments=segments, radius=radius)
             az_res = sim.simulate_azimuth_pattern(
-                model, freq_mhz=freq, height_m=height_m, ground=ground, el=el_fixed, az_step=5.0
+                model, freq_mhz=freq, height_m=height_m, ground=ground, el=el_fixed, az_step=5.0, return_format='structured'
             )
-            fwd_gain = next(p['gain'] for p in az_res if abs(p['az'] - 0.0) < 1e-6)
-            back_gain = next(p['gain'] for p in az_res if abs(p['az'] - 180.0) < 1e-6)
+            fwd_gain, back_gain = forward_back_gain(az_res)
             fgfb_rows.append([label, f"{fwd_gain:.2f}", f"{(fwd_gain - back_gain):.2f}"])
         # Half-wave dipole reference at this frequency
         ref_length = resonant_dipole_length(freq)
         ref_model = build_dipole_model(total_length=ref_length, segments=segments, radius=radius)
         az_res_ref = sim.simulate_azimuth_pattern(
-            ref_model, freq_mhz=freq, height_m=height_m, ground=ground, el=el_fixed, az_step=5.0
+            ref_model, freq_mhz=freq, height_m=height_m, ground=ground, el=el_fixed, az_step=5.0, return_format='structured'
         )
-        fwd_ref = next(p['gain'] for p in az_res_ref if abs(p['az'] - 0.0) < 1e-6)
-        back_ref = next(p['gain'] for p in az_res_ref if abs(p['az'] - 180.0) < 1e-6)
+        fwd_ref, back_ref = forward_back_gain(az_res_ref)
         fgfb_rows.append(["Half-wave dipole", f"{fwd_ref:.2f}", f"{(fwd_ref - back_ref):.2f}"])
         report.add_table(
             f"Forward Gain and F/B at {freq:.1f} MHz",
@@ -176,47 +170,33 @@ def main():
         )
 
     # Pattern plots for each frequency (including beam cases and half-wave dipole reference)
-    for freq in freqs_mhz:
-        elev_pats: Dict[str, List[Dict[str, float]]] = {}
-        az_pats: Dict[str, List[Dict[str, float]]] = {}
-        # Beam/reflector cases
-        for label, detune in cases:
-            if detune is None:
-                driven_length_m = feet_to_meters(88.0)
-                model = build_dipole_model(total_length=driven_length_m, segments=segments, radius=radius)
-            else:
-                model = build_two_element_beam_88ft(detune, segments=segments, radius=radius)
+    def freq_pattern_curves(freq):
+        # Yield (label, elevation, azimuth) one case at a time so the plotter never
+        # needs every case's pattern dicts alive at once
+        ref_label = "Half-wave dipole"
+        ref_length = resonant_dipole_length(freq)
+        models = [
+            (label, build_dipole_model(total_length=feet_to_meters(88.0), segments=segments, radius=radius)
+             if detune is None else build_two_element_beam_88ft(detune, segments=segments, radius=radius))
+            for label, detune in cases
+        ]
+        models.append((ref_label, build_dipole_model(total_length=ref_length, segments=segments, radius=radius)))
+        for label, model in models:
             # Elevation (az=0)
             res = sim.simulate_pattern(
                 model, freq_mhz=freq, height_m=height_m, ground=ground,
-                el_step=1.0, az_step=360.0
+                el_step=1.0, az_step=360.0, return_format='structured'
             )
-            elev_pats[label] = res['pattern']
             # Azimuth (el fixed)
-            az_pats[label] = sim.simulate_azimuth_pattern(
+            az_pat = sim.simulate_azimuth_pattern(
                 model, freq_mhz=freq, height_m=height_m, ground=ground,
-                el=el_fixed, az_step=5.0
+                el=el_fixed, az_step=5.0, return_format='structured'
             )
-        # Half-wave dipole reference
-        ref_label = "Half-wave dipole"
-        ref_length = resonant_dipole_length(freq)
-        ref_model = build_dipole_model(total_length=ref_length, segments=segments, radius=radius)
-        res_ref = sim.simulate_pattern(
-            ref_model, freq_mhz=freq, height_m=height_m, ground=ground,
-            el_step=1.0, az_step=360.0
-        )
-        elev_pats[ref_label] = res_ref['pattern']
-        az_pats[ref_label] = sim.simulate_azimuth_pattern(
-            ref_model, freq_mhz=freq, height_m=height_m, ground=ground,
-            el=el_fixed, az_step=5.0
-        )
-        # Compile labels including dipole ref
-        plot_labels = [label for label, _ in cases] + [ref_label]
+            yield label, res['pattern'], az_pat
+
+    for freq in freqs_mhz:
         output_file = os.path.join(report.report_dir, f'polar_patterns_{freq:.1f}MHz.png')
-        plot_polar_patterns(
-            elev_pats, az_pats, plot_labels, el_fixed,
-            output_file, args.show_gui, legend_labels=plot_labels
-        )
+        plot_polar_pattern_stream(freq_pattern_curves(freq), el_fixed, output_file, args.show_gui)
         report.add_plot(
             f'Polar Patterns at {freq:.1f} MHz',
             output_file,
@@ -232,29 +212,28 @@ def main():
         for df in detune_fracs:
             m = build_two_element_beam_88ft(df, segments=segments, radius=radius)
             azres = sim.simulate_azimuth_pattern(
-                m, freq_mhz=7.1, height_m=h, ground=ground, el=el_fixed, az_step=5.0
+                m, freq_mhz=7.1, height_m=h, ground=ground, el=el_fixed, az_step=5.0, return_format='structured'
             )
-            fwd = next(p['gain'] for p in azres if abs(p['az']) < 1e-6)
-            back = next(p['gain'] for p in azres if abs(p['az'] - 180.0) < 1e-6)
+            fwd, back = forward_back_gain(azres)
             fb = fwd - back
             if fb > best_fb:
                 best_fb = fb
                 best_df = df
         best_detunes[h] = best_df
     # Multi-height beam-only patterns at 7.1 MHz for heights 10m, 15m, 20m
-    elev_multi: Dict[float, List[Dict[str, float]]] = {}
-    az_multi: Dict[float, List[Dict[str, float]]] = {}
+    elev_multi: Dict[float, np.ndarray] = {}
+    az_multi: Dict[float, np.ndarray] = {}
     for h in heights_study:
         df = best_detunes[h]
         m = build_two_element_beam_88ft(df, segments=segments, radius=radius)
         res = sim.simulate_pattern(
             m, freq_mhz=7.1, height_m=h, ground=ground,
-            el_step=1.0, az_step=360.0
+            el_step=1.0, az_step=360.0, return_format='structured'
         )
         elev_multi[h] = res['pattern']
         az_multi[h] = sim.simulate_azimuth_pattern(
             m, freq_mhz=7.1, height_m=h, ground=ground,
-            el=el_fixed, az_step=5.0
+            el=el_fixed, az_step=5.0, return_format='structured'
         )
     multi_labels = [f"{h:.0f} m" for h in heights_study]
     multi_file = os.path.join(report.report_dir, 'beam_patterns_heights_7.1MHz.png')
@@ -274,22 +253,22 @@ def main():
         beam_model = build_two_element_beam_88ft(df, segments=segments, radius=radius)
         beam_el_pat = sim.simulate_pattern(
             beam_model, freq_mhz=7.1, height_m=h, ground=ground,
-            el_step=1.0, az_step=360.0
+            el_step=1.0, az_step=360.0, return_format='structured'
         )['pattern']
         beam_az_pat = sim.simulate_azimuth_pattern(
             beam_model, freq_mhz=7.1, height_m=h, ground=ground,
-            el=el_fixed, az_step=5.0
+            el=el_fixed, az_step=5.0, return_format='structured'
         )
         # Dipole reference pattern
         dip_length = resonant_dipole_length(7.1)
         dip_model = build_dipole_model(total_length=dip_length, segments=segments, radius=radius)
         dip_el_pat = sim.simulate_pattern(
             dip_model, freq_mhz=7.1, height_m=h, ground=ground,
-            el_step=1.0, az_step=360.0
+            el_step=1.0, az_step=360.0, return_format='structured'
         )['pattern']
         dip_az_pat = sim.simulate_azimuth_pattern(
             dip_model, freq_mhz=7.1, height_m=h, ground=ground,
-            el=el_fixed, az_step=5.0
+            el=el_fixed, az_step=5.0, return_format='structured'
         )
         # Compile patterns for comparison
         cmp_el_pats = {'Beam': beam_el_pat, 'Dipole': dip_el_pat}
@@ -312,10 +291,7 @@ def main():
         df = best_detunes[h]
         # Beam impedance
         beam_model = build_two_element_beam_88ft(df, segments=segments, radius=radius)
-        Rb, Xb = sim.simulate_pattern(
-            beam_model, freq_mhz=7.1, height_m=h, ground=ground,
-            el_step=45.0, az_step=360.0
-        )['impedance']
+        Rb, Xb = sim.simulate_impedance(beam_model, freq_mhz=7.1, height_m=h, ground=ground)
         if Xb > 0:
             Cb = 1/(2*math.pi*7.1e6*Xb)
             matchb = f"C={Cb*1e12:.1f} pF"
@@ -326,10 +302,7 @@ def main():
         # Dipole impedance
         dip_length = resonant_dipole_length(7.1)
         dip_model = build_dipole_model(total_length=dip_length, segments=segments, radius=radius)
-        Rd, Xd = sim.simulate_pattern(
-            dip_model, freq_mhz=7.1, height_m=h, ground=ground,
-            el_step=45.0, az_step=360.0
-        )['impedance']
+        Rd, Xd = sim.simulate_impedance(dip_model, freq_mhz=7.1, height_m=h, ground=ground)
         if Xd > 0:
             Cd = 1/(2*math.pi*7.1e6*Xd)
             matchd = f"C={Cd*1e12:.1f} pF"
@@ -350,19 +323,17 @@ def main():
         # Beam at optimum detune
         beam_model = build_two_element_beam_88ft(df, segments=segments, radius=radius)
         az_beam = sim.simulate_azimuth_pattern(
-            beam_model, freq_mhz=7.1, height_m=h, ground=ground, el=el_fixed, az_step=5.0
+            beam_model, freq_mhz=7.1, height_m=h, ground=ground, el=el_fixed, az_step=5.0, return_format='structured'
         )
-        fwd_beam = next(p['gain'] for p in az_beam if abs(p['az']) < 1e-6)
-        back_beam = next(p['gain'] for p in az_beam if abs(p['az'] - 180.0) < 1e-6)
+        fwd_beam, back_beam = forward_back_gain(az_beam)
         fb_beam = fwd_beam - back_beam
         # No reflector (dipole)
         driven_len_m = feet_to_meters(88.0)
         no_ref_model = build_dipole_model(total_length=driven_len_m, segments=segments, radius=radius)
         az_no = sim.simulate_azimuth_pattern(
-            no_ref_model, freq_mhz=7.1, height_m=h, ground=ground, el=el_fixed, az_step=5.0
+            no_ref_model, freq_mhz=7.1, height_m=h, ground=ground, el=el_fixed, az_step=5.0, return_format='structured'
         )
-        fwd_no = next(p['gain'] for p in az_no if abs(p['az']) < 1e-6)
-        back_no = next(p['gain'] for p in az_no if abs(p['az'] - 180.0) < 1e-6)
+        fwd_no, back_no = forward_back_gain(az_no)
         fb_no = fwd_no - back_no
         fgfb_height_rows.append([
             f"{h:.0f}", f"{df*100:.1f}%", f"{fwd_beam:.2f}", f"{fb_beam:.2f}", f"{fwd_no:.2f}", f"{fb_no:.2f}"
@@ -379,10 +350,7 @@ def main():
         imp_spacing: List[List[str]] = []
         for df in detune_fracs:
             model = build_two_element_beam_88ft(df, driven_length_ft=88.0, spacing_ft=spacing_ft, segments=segments, radius=radius)
-            R, X = sim.simulate_pattern(
-                model, freq_mhz=7.1, height_m=height_m, ground=ground,
-                el_step=45.0, az_step=360.0
-            )['impedance']
+            R, X = sim.simulate_impedance(model, freq_mhz=7.1, height_m=height_m, ground=ground)
             imp_spacing.append([f"{int(df*100)}%", f"{R:.2f}", f"{X:.2f}"])
         report.add_table(
             f'Feedpoint Impedance vs Detune (spacing={int(spacing_ft)} ft)',
@@ -391,17 +359,17 @@ def main():
             parameters=f"frequency=7.1 MHz; height={height_m} m; spacing={int(spacing_ft)} ft; ground={ground}; segments={segments}; radius={radius} m"
         )
         # Pattern plots vs detune
-        elev_sweep: Dict[float, List[Dict[str, float]]] = {}
-        az_sweep: Dict[float, List[Dict[str, float]]] = {}
+        elev_sweep: Dict[float, np.ndarray] = {}
+        az_sweep: Dict[float, np.ndarray] = {}
         for df in detune_fracs:
             model = build_two_element_beam_88ft(df, driven_length_ft=88.0, spacing_ft=spacing_ft, segments=segments, radius=radius)
             elev_sweep[df] = sim.simulate_pattern(
                 model, freq_mhz=7.1, height_m=height_m, ground=ground,
-                el_step=1.0, az_step=360.0
+                el_step=1.0, az_step=360.0, return_format='structured'
             )['pattern']
             az_sweep[df] = sim.simulate_azimuth_pattern(
                 model, freq_mhz=7.1, height_m=height_m, ground=ground,
-                el=el_fixed, az_step=5.0
+                el=el_fixed, az_step=5.0, return_format='structured'
             )
         labels = [f"{int(df*100)}%" for df in detune_fracs]
         out_png = os.path.join(report.report_dir, f'detune_sweep_spacing_{int(spacing_ft)}ft.png')
@@ -418,9 +386,8 @@ def main():
         fgfb_rows_sp: List[List[str]] = []
         for df in detune_fracs:
             model = build_two_element_beam_88ft(df, driven_length_ft=88.0, spacing_ft=spacing_ft, segments=segments, radius=radius)
-            az = sim.simulate_azimuth_pattern(model, freq_mhz=7.1, height_m=height_m, ground=ground, el=el_fixed, az_step=5.0)
-            fwd = next(p['gain'] for p in az if abs(p['az']) < 1e-6)
-            back = next(p['gain'] for p in az if abs(p['az'] - 180.0) < 1e-6)
+            az = sim.simulate_azimuth_pattern(model, freq_mhz=7.1, height_m=height_m, ground=ground, el=el_fixed, az_step=5.0, return_format='structured')
+            fwd, back = forward_back_gain(az)
             fgfb_rows_sp.append([f"{int(df*100)}%", f"{fwd:.2f}", f"{(fwd-back):.2f}"])
         report.add_table(
             f'Forward Gain & F/B vs Detune (spacing={int(spacing_ft)} ft)',
@@ -17,6 +17,8 @@ from antenna_model import (
     compute_elevation_patterns,
     compute_azimuth_patterns,
     plot_polar_patterns,
+    gain_by_angle,
+    forward_back_gain,
     Report,
 )
 from typing import Dict, List
@@ -89,13 +91,14 @@ def main():
     report.add_table('Feedpoint Impedance vs Height', ['Height (m)', 'R (Ω)', 'X (Ω)'], imp_list, parameters="frequency = 14.1 MHz; detune = 5%; spacing = 0.20 λ; ground = average; segments = 21; radius = 0.001 m")
 
     # 2) Compute elevation patterns and build bolded gain table
-    el_pats = compute_elevation_patterns(sim, model, freq_mhz, heights, ground)
+    el_pats = compute_elevation_patterns(sim, model, freq_mhz, heights, ground, return_format='structured')
     el_angles = list(range(0, 181, 5))
     # Build raw rows
     headers = ['Elevation (deg)'] + [f'{h:.1f} m' for h in heights]
     rows = []
+    el_gains = {h: gain_by_angle(el_pats[h], 'el') for h in heights}
     for el in el_angles:
-        vals = [next((p['gain'] for p in el_pats[h] if abs(p['el'] - el) < 1e-6), '') for h in heights]
+        vals = [el_gains[h].get(el, '') for h in heights]
         rows.append([el] + vals)
     # Determine peak gain per height column
     peaks = []
@@ -118,7 +121,7 @@ def main():
 
     # 3) Compute azimuth patterns at fixed elevation and plot
     el_fixed = 30.0
-    az_pats = compute_azimuth_patterns(sim, model, freq_mhz, heights, ground, el=el_fixed)
+    az_pats = compute_azimuth_patterns(sim, model, freq_mhz, heights, ground, el=el_fixed, return_format='structured')
 
     # 5) Spacing sweep: Forward Gain and F/B tables across spacing fractions
     detunes = np.linspace(0.0, 0.10, 11)
@@ -146,8 +149,7 @@ def main():
                 m2, freq_mhz=freq_mhz, height_m=10.0,
                 ground=ground, el=el_fixed, az_step=5.0
             )
-            fwd = next(p['gain'] for p in az_res if abs(p['az']) < 1e-6)
-            back = next(p['gain'] for p in az_res if abs(p['az'] - 180.0) < 1e-6)
+            fwd, back = forward_back_gain(az_res)
             fg_row.append(fwd)
             fb_row.append(fwd - back)
         fg_matrix.append(fg_row)
@@ -211,10 +213,10 @@ def main():
     # Simulate both at h=10m
     cmp_height = 10.0
     cmp_heights = [cmp_height]
-    yagi_el_pat = compute_elevation_patterns(sim, yagi_model, freq_mhz, cmp_heights, ground)[cmp_height]
-    yagi_az_pat = compute_azimuth_patterns(sim, yagi_model, freq_mhz, cmp_heights, ground, el=el_fixed)[cmp_height]
-    dipole_el_pat = compute_elevation_patterns(sim, dipole_model, freq_mhz, cmp_heights, ground)[cmp_height]
-    dipole_az_pat = compute_azimuth_patterns(sim, dipole_model, freq_mhz, cmp_heights, ground, el=el_fixed)[cmp_height]
+    yagi_el_pat = compute_elevation_patterns(sim, yagi_model, freq_mhz, cmp_heights, ground, return_format='structured')[cmp_height]
+    yagi_az_pat = compute_azimuth_patterns(sim, yagi_model, freq_mhz, cmp_heights, ground, el=el_fixed, return_format='structured')[cmp_height]
+    dipole_el_pat = compute_elevation_patterns(sim, dipole_model, freq_mhz, cmp_heights, ground, return_format='structured')[cmp_height]
+    dipole_az_pat = compute_azimuth_patterns(sim, dipole_model, freq_mhz, cmp_heights, ground, el=el_fixed, return_format='structured')[cmp_height]
     cmp_elev_pats = {"Yagi": yagi_el_pat, "Dipole": dipole_el_pat}
     cmp_az_pats = {"Yagi": yagi_az_pat, "Dipole": dipole_az_pat}
     cmp_labels = ["Yagi (detune=6%, spacing=0.30λ)", "Dipole"]
@@ -6,6 +6,8 @@ Outputs tables and plots similar to 2_el_yagi.py, focusing on half-wavelength he
 """
 import math
 import argparse
+import functools
+from multiprocessing import Pool
 import matplotlib.pyplot as plt
 import numpy as np
 from antenna_model import (
@@ -17,6 +19,10 @@ from antenna_model import (
     compute_elevation_patterns,
     compute_azimuth_patterns,
     plot_polar_patterns,
+    configure_polar_axes,
+    forward_back_gain,
+    max_gain,
+    polar_coords_shared,
     Report,
 )
 import os
@@ -33,37 +39,102 @@ HEIGHT_M = 0.5 * wavelength_m_global  # 0.5 λ height (~half-wavelength)
 
 # Helper to build Yagi
 
-def build_two_element_yagi_model(freq_mhz, detune_frac, spacing_m, segments=SEGMENTS, radius=RADIUS):
-    driven_length = resonant_dipole_length(freq_mhz)
-    half_driven = driven_length / 2.0
-    passive_length = resonant_dipole_length(freq_mhz / (1.0 + detune_frac))
-    half_passive = passive_length / 2.0
+def build_scaled_yagi_model(driven_len, refl_len, spacing_m, segments=SEGMENTS, radius=RADIUS):
+    """Build a 2-el Yagi from explicit driven/reflector lengths (m) and spacing (m)."""
+    half_d = driven_len / 2
+    half_r = refl_len / 2
     model = AntennaModel()
-    el1 = AntennaElement(
-        x1=0.0, y1=-half_driven, z1=0.0,
-        x2=0.0, y2=half_driven, z2=0.0,
-        segments=segments, radius=radius,
-    )
-    model.add_element(el1)
-    center_seg = (segments + 1) // 2
-    model.add_feedpoint(element_index=0, segment=center_seg)
-    el2 = AntennaElement(
-        x1=-spacing_m, y1=-half_passive, z1=0.0,
-        x2=-spacing_m, y2=half_passive, z2=0.0,
-        segments=segments, radius=radius,
-    )
-    model.add_element(el2)
+    model.add_element(AntennaElement(
+        x1=0.0, y1=-half_d, z1=0.0, x2=0.0, y2=half_d, z2=0.0, segments=segments, radius=radius))
+    model.add_feedpoint(element_index=0, segment=(segments + 1) // 2)
+    model.add_element(AntennaElement(
+        x1=-spacing_m, y1=-half_r, z1=0.0, x2=-spacing_m, y2=half_r, z2=0.0, segments=segments, radius=radius))
     return model
 
+# One simulator per process: set by the Pool initializer in workers, lazily in the parent
+_SIM = None
+
+def _init_worker():
+    global _SIM
+    _SIM = AntennaSimulator()
+
+def _get_sim():
+    if _SIM is None:
+        _init_worker()
+    return _SIM
+
+def _eval_fwd_fb(args):
+    """Worker: forward gain and F/B at 30° elevation for one (reflector length, spacing) cell."""
+    driven_len, refl_len, spacing_m = args
+    model = build_scaled_yagi_model(driven_len, refl_len, spacing_m)
+    az_res = _get_sim().simulate_azimuth_pattern(
+        model, FREQ_MHZ, height_m=HEIGHT_M, ground=GROUND, el=30.0, az_step=5.0,
+        return_format='structured'
+    )
+    fwd, back = forward_back_gain(az_res)
+    return fwd, fwd - back
+
+def _eval_det(args):
+    """Worker: impedance and F/B at 30° for one reflector length; None if |X| > 5 Ω."""
+    scale, det, driven_len, refl_len, spacing_m = args
+    sim = _get_sim()
+    model = build_scaled_yagi_model(driven_len, refl_len, spacing_m)
+    R_imp, X_imp = sim.simulate_impedance(model, FREQ_MHZ, height_m=HEIGHT_M, ground=GROUND)
+    if abs(X_imp) > 5.0:
+        return None
+    # Fast azimuth pattern (0 & 180)
+    az_pat = sim.simulate_azimuth_pattern(model, FREQ_MHZ, height_m=HEIGHT_M, ground=GROUND, el=30.0, az_step=180.0,
+                                      return_format='structured')
+    fwd, back = forward_back_gain(az_pat)
+    return (scale, det, R_imp, X_imp, fwd - back, fwd)
+
+GOLDEN = (math.sqrt(5.0) - 1.0) / 2.0
+
+def golden_section_max(f, lo, hi, tol=0.005):
+    """Maximise a unimodal f on [lo, hi] by golden-section search; returns (x, f(x))."""
+    a, b = lo, hi
+    c = b - GOLDEN * (b - a)
+    d = a + GOLDEN * (b - a)
+    fc, fd = f(c), f(d)
+    while b - a > tol:
+        if fc >= fd:
+            b, d, fd = d, c, fc
+            c = b - GOLDEN * (b - a)
+            fc = f(c)
+        else:
+            a, c, fc = c, d, fd
+            d = a + GOLDEN * (b - a)
+            fd = f(d)
+    return (c, fc) if fc >= fd else (d, fd)
+
+def _fast_boom_best(boom_m, lo=0.0, hi=0.10):
+    """Worker: detunes maximising forward gain and F/B for one boom via golden-section search."""
+    driven_len = resonant_dipole_length(FREQ_MHZ)
+    evals = {}  # both searches start from the same interior points, so share solves
+
+    def fwd_fb(det):
+        if det not in evals:
+            evals[det] = _eval_fwd_fb((driven_len, resonant_dipole_length(FREQ_MHZ / (1.0 + det)), boom_m))
+        return evals[det]
+
+    det_gain, best_gain = golden_section_max(lambda d: fwd_fb(d)[0], lo, hi)
+    det_fb, best_fb = golden_section_max(lambda d: fwd_fb(d)[1], lo, hi)
+    return best_gain, det_gain, best_fb, det_fb
+
+def _geometry_key(driven_len, refl_len, spacing_m):
+    # Round to 9 decimals so float noise in derived lengths does not defeat the caches
+    return (round(driven_len, 9), round(refl_len, 9), round(spacing_m, 9))
+
 def main():
     parser = argparse.ArgumentParser(description="2-el Yagi 15m optimization sweep")
     parser.add_argument('--show-gui', action='store_true', help='Show plots interactively instead of saving')
+    parser.add_argument('--fast-detune', action='store_true',
+                        help='Find per-boom optimum detunes by golden-section search instead of the 21-point sweep')
     args = parser.parse_args()
 
     wavelength_m = wavelength_m_global
     driven_length = resonant_dipole_length(FREQ_MHZ)
-    center_seg = (SEGMENTS + 1) // 2
-    sim = AntennaSimulator()
+    sim = _get_sim()
 
     # Sweep boom length (spacing) in 1 ft increments from 2 to 10 ft
     boom_lengths_ft = np.arange(2, 11, 1)  # 2, 3, ..., 10
@@ -76,41 +147,59 @@ def main():
     results = []  # Each entry: dict with boom_ft, boom_m, boom_lambda, best_gain, best_gain_detune, best_fb, best_fb_detune
     sweep_table = []  # For detailed table: boom_ft, detune, gain, fb
 
-    for boom_ft, boom_m, boom_lam in zip(boom_lengths_ft, boom_lengths_m, boom_lengths_lambda):
-        best_gain = -999
-        best_gain_detune = None
-        best_fb = -999
-        best_fb_detune = None
-        gain_vs_detune = []
-        fb_vs_detune = []
-        for detune in detune_fracs:
-            model = build_two_element_yagi_model(FREQ_MHZ, detune, boom_m)
-            az_pat = sim.simulate_azimuth_pattern(
-                model, FREQ_MHZ, height_m=HEIGHT_M, ground=GROUND, el=30.0, az_step=5.0
-            )
-            fwd = next(p['gain'] for p in az_pat if abs(p['az']) < 1e-6)
-            back = next(p['gain'] for p in az_pat if abs(p['az'] - 180.0) < 1e-6)
-            fb = fwd - back
-            gain_vs_detune.append(fwd)
-            fb_vs_detune.append(fb)
-            sweep_table.append([boom_ft, detune, fwd, fb])
-            if fwd > best_gain:
-                best_gain = fwd
-                best_gain_detune = detune
-            if fb > best_fb:
-                best_fb = fb
-                best_fb_detune = detune
-        results.append({
-            'boom_ft': boom_ft,
-            'boom_m': boom_m,
-            'boom_lambda': boom_lam,
-            'best_gain': best_gain,
-            'best_gain_detune': best_gain_detune,
-            'best_fb': best_fb,
-            'best_fb_detune': best_fb_detune,
-            'gain_vs_detune': gain_vs_detune,
-            'fb_vs_detune': fb_vs_detune,
-        })
+    if args.fast_detune:
+        # Only the per-boom optima are reported, so locate them by golden-section search
+        with Pool(processes=os.cpu_count(), initializer=_init_worker) as pool:
+            boom_best = pool.map(_fast_boom_best, boom_lengths_m)
+        for boom_ft, boom_m, boom_lam, (best_gain, best_gain_detune, best_fb, best_fb_detune) in zip(
+                boom_lengths_ft, boom_lengths_m, boom_lengths_lambda, boom_best):
+            results.append({
+                'boom_ft': boom_ft,
+                'boom_m': boom_m,
+                'boom_lambda': boom_lam,
+                'best_gain': best_gain,
+                'best_gain_detune': best_gain_detune,
+                'best_fb': best_fb,
+                'best_fb_detune': best_fb_detune,
+                'gain_vs_detune': [],
+                'fb_vs_detune': [],
+            })
+    else:
+        # All (boom, detune) solves are independent: run them on a process pool up front
+        refl_lengths = resonant_dipole_length(FREQ_MHZ / (1.0 + np.asarray(detune_fracs))).tolist()
+        tasks = [(driven_length, refl_len, boom_m) for boom_m in boom_lengths_m for refl_len in refl_lengths]
+        with Pool(processes=os.cpu_count(), initializer=_init_worker) as pool:
+            boom_cells = pool.map(_eval_fwd_fb, tasks)
+        n_det = len(detune_fracs)
+
+        for i, (boom_ft, boom_m, boom_lam) in enumerate(zip(boom_lengths_ft, boom_lengths_m, boom_lengths_lambda)):
+            best_gain = -999
+            best_gain_detune = None
+            best_fb = -999
+            best_fb_detune = None
+            gain_vs_detune = []
+            fb_vs_detune = []
+            for detune, (fwd, fb) in zip(detune_fracs, boom_cells[i * n_det:(i + 1) * n_det]):
+                gain_vs_detune.append(fwd)
+                fb_vs_detune.append(fb)
+                sweep_table.append([boom_ft, detune, fwd, fb])
+                if fwd > best_gain:
+                    best_gain = fwd
+                    best_gain_detune = detune
+                if fb > best_fb:
+                    best_fb = fb
+                    best_fb_detune = detune
+            results.append({
+                'boom_ft': boom_ft,
+                'boom_m': boom_m,
+                'boom_lambda': boom_lam,
+                'best_gain': best_gain,
+                'best_gain_detune': best_gain_detune,
+                'best_fb': best_fb,
+                'best_fb_detune': best_fb_detune,
+                'gain_vs_detune': gain_vs_detune,
+                'fb_vs_detune': fb_vs_detune,
+            })
 
     # Create report
     report = Report('2_el_yagi_15m')
@@ -131,6 +220,7 @@ def main():
         ['Boom (ft, λ)', 'Max Gain (dBi)', 'Detune for Max Gain (%)', 'Max F/B (dB)', 'Detune for Max F/B (%)'],
         table_rows,
         parameters=f"frequency = {FREQ_MHZ} MHz; height = {HEIGHT_M:.2f} m (~0.5λ); ground = {GROUND}; segments = {SEGMENTS}; radius = {RADIUS} m; elevation = 30° (azimuth pattern)"
+        + ("; detune optimised by golden-section search" if args.fast_detune else "")
     )
 
     # === Detune vs Spacing sweep tables (mirrors original 20 m script) ===
@@ -140,44 +230,20 @@ def main():
     fg_matrix = []  # forward gain (dBi)
     fb_matrix = []  # F/B (dB)
 
-    # Pre-build the driven element once
-    half_driven_len = driven_length / 2.0
-    driven_elem = AntennaElement(
-        x1=0.0, y1=-half_driven_len, z1=0.0,
-        x2=0.0, y2=half_driven_len, z2=0.0,
-        segments=SEGMENTS, radius=RADIUS,
-    )
-
-    for detune in detune_steps:
-        # Lengthen reflector
-        passive_length = resonant_dipole_length(FREQ_MHZ / (1.0 + detune))
-        half_passive_len = passive_length / 2.0
-
-        fg_row = []
-        fb_row = []
-        for frac in spacing_fracs:
-            spacing_m = frac * wavelength_m
-
-            model = AntennaModel()
-            model.add_element(driven_elem)
-            model.add_feedpoint(element_index=0, segment=center_seg)
-            # Reflector
-            ref = AntennaElement(
-                x1=-spacing_m, y1=-half_passive_len, z1=0.0,
-                x2=-spacing_m, y2=half_passive_len, z2=0.0,
-                segments=SEGMENTS, radius=RADIUS,
-            )
-            model.add_element(ref)
-
-            az_res = sim.simulate_azimuth_pattern(
-                model, FREQ_MHZ, height_m=HEIGHT_M, ground=GROUND, el=30.0, az_step=5.0
-            )
-            fwd = next(p['gain'] for p in az_res if abs(p['az']) < 1e-6)
-            back = next(p['gain'] for p in az_res if abs(p['az'] - 180.0) < 1e-6)
-            fg_row.append(fwd)
-            fb_row.append(fwd - back)
-        fg_matrix.append(fg_row)
-        fb_matrix.append(fb_row)
+    # Every (detune, spacing) cell is an independent NEC solve; evaluate them on a
+    # process pool and reassemble the matrices in sweep order.
+    tasks = [
+        (driven_length, resonant_dipole_length(FREQ_MHZ / (1.0 + detune)), frac * wavelength_m)
+        for detune in detune_steps
+        for frac in spacing_fracs
+    ]
+    with Pool(processes=os.cpu_count(), initializer=_init_worker) as pool:
+        cells = pool.map(_eval_fwd_fb, tasks)
+    n_sp = len(spacing_fracs)
+    for i in range(len(detune_steps)):
+        row_cells = cells[i * n_sp:(i + 1) * n_sp]
+        fg_matrix.append([fwd for fwd, _ in row_cells])
+        fb_matrix.append([fb for _, fb in row_cells])
 
     # Bold peaks per spacing column
     fg_peaks = [max(col) for col in zip(*fg_matrix)]
@@ -228,9 +294,8 @@ def main():
     # --- Half-wave dipole reference at same height/elevation ---
     dipole_length = resonant_dipole_length(FREQ_MHZ)
     dipole_model = build_dipole_model(total_length=dipole_length, segments=SEGMENTS, radius=RADIUS)
-    dip_az = sim.simulate_azimuth_pattern(dipole_model, FREQ_MHZ, height_m=HEIGHT_M, ground=GROUND, el=30.0, az_step=5.0)
-    dip_fwd_gain = next(p['gain'] for p in dip_az if abs(p['az']) < 1e-6)
-    dip_back_gain = next(p['gain'] for p in dip_az if abs(p['az'] - 180.0) < 1e-6)
+    dip_az = sim.simulate_azimuth_pattern(dipole_model, FREQ_MHZ, height_m=HEIGHT_M, ground=GROUND, el=30.0, az_step=5.0, return_format='structured')
+    dip_fwd_gain, dip_back_gain = forward_back_gain(dip_az)
     dip_fb = dip_fwd_gain - dip_back_gain
 
     # --- Half-wave dipole reference table ---
@@ -252,6 +317,7 @@ def main():
     spacing_az_gain = {}
     spacing_elev_fb = {}
     spacing_az_fb = {}
+    spacing_imp_fb = {}
 
     for j_idx, frac in zip(idx_subset, spacing_subset):
         # Determine detune for max gain and max F/B
@@ -267,52 +333,41 @@ def main():
 
         # Build model for best gain
         passive_len_gain = resonant_dipole_length(FREQ_MHZ / (1.0 + detune_gain))
-        half_passive_gain = passive_len_gain / 2.0
         # Build model for best F/B
         passive_len_fb = resonant_dipole_length(FREQ_MHZ / (1.0 + detune_fb))
-        half_passive_fb = passive_len_fb / 2.0
 
         spacing_m = frac * wavelength_m
 
         # ---- Best gain model ----
-        model = AntennaModel()
-        model.add_element(driven_elem)
-        model.add_feedpoint(element_index=0, segment=center_seg)
-        ref = AntennaElement(
-            x1=-spacing_m, y1=-half_passive_gain, z1=0.0,
-            x2=-spacing_m, y2=half_passive_gain, z2=0.0,
-            segments=SEGMENTS, radius=RADIUS,
-        )
-        model.add_element(ref)
+        model = build_scaled_yagi_model(driven_length, passive_len_gain, spacing_m)
 
-        elev_pat_res = sim.simulate_pattern(model, FREQ_MHZ, height_m=HEIGHT_M, ground=GROUND, el_step=5.0, az_step=360.0)
+        elev_pat_res = sim.simulate_pattern(model, FREQ_MHZ, height_m=HEIGHT_M, ground=GROUND, el_step=5.0, az_step=360.0, return_format='structured')
         spacing_elev_gain[frac] = elev_pat_res['pattern']
 
-        az_pat_res = sim.simulate_azimuth_pattern(model, FREQ_MHZ, height_m=HEIGHT_M, ground=GROUND, el=30.0, az_step=5.0)
+        az_pat_res = sim.simulate_azimuth_pattern(model, FREQ_MHZ, height_m=HEIGHT_M, ground=GROUND, el=30.0, az_step=5.0, return_format='structured')
         spacing_az_gain[frac] = az_pat_res
 
         # ---- Best F/B model ----
-        model_fb = AntennaModel()
-        model_fb.add_element(driven_elem)
-        model_fb.add_feedpoint(element_index=0, segment=center_seg)
-        ref_fb = AntennaElement(
-            x1=-spacing_m, y1=-half_passive_fb, z1=0.0,
-            x2=-spacing_m, y2=half_passive_fb, z2=0.0,
-            segments=SEGMENTS, radius=RADIUS,
-        )
-        model_fb.add_element(ref_fb)
-
-        elev_fb = sim.simulate_pattern(model_fb, FREQ_MHZ, height_m=HEIGHT_M, ground=GROUND, el_step=5.0, az_step=360.0)
+        # Only the reflector differs from the best-gain model; when the optimal detunes
+        # coincide the geometry is identical and the solves above can be reused.
+        if detune_fb == detune_gain:
+            elev_fb, az_fb = elev_pat_res, az_pat_res
+        else:
+            half_fb = passive_len_fb / 2
+            model_fb = model.with_element(1, AntennaElement(
+                x1=-spacing_m, y1=-half_fb, z1=0.0, x2=-spacing_m, y2=half_fb, z2=0.0,
+                segments=SEGMENTS, radius=RADIUS))
+            elev_fb = sim.simulate_pattern(model_fb, FREQ_MHZ, height_m=HEIGHT_M, ground=GROUND, el_step=5.0, az_step=360.0, return_format='structured')
+            az_fb = sim.simulate_azimuth_pattern(model_fb, FREQ_MHZ, height_m=HEIGHT_M, ground=GROUND, el=30.0, az_step=5.0, return_format='structured')
         spacing_elev_fb[frac] = elev_fb['pattern']
-
-        az_fb = sim.simulate_azimuth_pattern(model_fb, FREQ_MHZ, height_m=HEIGHT_M, ground=GROUND, el=30.0, az_step=5.0)
+        spacing_imp_fb[frac] = elev_fb['impedance']
         spacing_az_fb[frac] = az_fb
 
     # Legend labels include optimal detune percentage
     labels_gain = [f"{frac:.3f}λ ({dg*100:.0f}%)" for frac, dg in zip(spacing_subset, detune_gain_list)]
     labels_fb = [f"{frac:.3f}λ ({df*100:.0f}%)" for frac, df in zip(spacing_subset, detune_fb_list)]
     # Compute dipole elevation and azimuth patterns for reference
-    dip_elev_res = sim.simulate_pattern(dipole_model, FREQ_MHZ, height_m=HEIGHT_M, ground=GROUND, el_step=5.0, az_step=360.0)
+    dip_elev_res = sim.simulate_pattern(dipole_model, FREQ_MHZ, height_m=HEIGHT_M, ground=GROUND, el_step=5.0, az_step=360.0, return_format='structured')
     dip_elev_pat = dip_elev_res['pattern']
     dip_az_res = dip_az  # already simulated earlier
     # Add dipole to dictionaries
@@ -330,26 +385,26 @@ def main():
     polar_gain_plot = os.path.join('output/2_el_yagi_15m', 'spacing_subset_polar_gain.png')
     fig, (ax_el, ax_az) = plt.subplots(1, 2, subplot_kw={'polar': True}, figsize=(14, 7))
     colors = plt.rcParams['axes.prop_cycle'].by_key()['color']
+    # Per-curve (label, color, linestyle), shared by both cuts of both figures; dipole dashed
+    def _curve_styles(keys, labels):
+        return [(lbl, colors[idx % len(colors)], '--' if key == 'dipole' else '-')
+                for idx, (key, lbl) in enumerate(zip(keys, labels))]
+    gain_styles = _curve_styles(keys_gain, labels_gain)
+    fb_styles = _curve_styles(keys_fb, labels_fb)
     # Elevation patterns
-    raw_max = max(max(p['gain'] for p in spacing_elev_gain[f]) for f in keys_gain)
-    from antenna_model import configure_polar_axes
+    raw_max = max_gain(*(spacing_elev_gain[f] for f in keys_gain))
     configure_polar_axes(ax_el, 'Elevation Pattern (az=0)', raw_max)
-    for idx, key in enumerate(keys_gain):
-        data = sorted(spacing_elev_gain[key], key=lambda p: p['el'])
-        theta = np.radians([p['el'] for p in data])
-        r = [0.89 ** ((raw_max - p['gain']) / 2.0) for p in data]
-        style = '--' if key == 'dipole' else '-'
-        ax_el.plot(theta, r, label=labels_gain[idx], color=colors[idx % len(colors)], linestyle=style)
+    # Every pattern shares one angle grid: sort and convert it once, all radii in one pass
+    theta, r_all = polar_coords_shared([spacing_elev_gain[key] for key in keys_gain], 'el', raw_max)
+    for r, (lbl, color, style) in zip(r_all, gain_styles):
+        ax_el.plot(theta, r, label=lbl, color=color, linestyle=style)
     ax_el.legend(loc='upper right', bbox_to_anchor=(1.2, 1.1))
     # Azimuth patterns
-    raw_max_az = max(max(p['gain'] for p in spacing_az_gain[f]) for f in keys_gain)
+    raw_max_az = max_gain(*(spacing_az_gain[f] for f in keys_gain))
     configure_polar_axes(ax_az, f'Azimuth Pattern (el=30°)', raw_max_az, zero_loc='E', direction=-1)
-    for idx, key in enumerate(keys_gain):
-        data = sorted(spacing_az_gain[key], key=lambda p: p['az'])
-        phi = np.radians([p['az'] for p in data])
-        r = [0.89 ** ((raw_max_az - p['gain']) / 2.0) for p in data]
-        style = '--' if key == 'dipole' else '-'
-        ax_az.plot(phi, r, label=labels_gain[idx], color=colors[idx % len(colors)], linestyle=style)
+    phi, r_all = polar_coords_shared([spacing_az_gain[key] for key in keys_gain], 'az', raw_max_az)
+    for r, (lbl, color, style) in zip(r_all, gain_styles):
+        ax_az.plot(phi, r, label=lbl, color=color, linestyle=style)
     ax_az.legend(loc='upper right', bbox_to_anchor=(1.2, 1.1))
     plt.tight_layout()
     plt.savefig(polar_gain_plot)
@@ -359,24 +414,18 @@ def main():
     polar_fb_plot = os.path.join('output/2_el_yagi_15m', 'spacing_subset_polar_fb.png')
     fig, (ax_el, ax_az) = plt.subplots(1, 2, subplot_kw={'polar': True}, figsize=(14, 7))
     # Elevation patterns
-    raw_max = max(max(p['gain'] for p in spacing_elev_fb[f]) for f in keys_fb)
+    raw_max = max_gain(*(spacing_elev_fb[f] for f in keys_fb))
     configure_polar_axes(ax_el, 'Elevation Pattern (az=0)', raw_max)
-    for idx, key in enumerate(keys_fb):
-        data = sorted(spacing_elev_fb[key], key=lambda p: p['el'])
-        theta = np.radians([p['el'] for p in data])
-        r = [0.89 ** ((raw_max - p['gain']) / 2.0) for p in data]
-        style = '--' if key == 'dipole' else '-'
-        ax_el.plot(theta, r, label=labels_fb[idx], color=colors[idx % len(colors)], linestyle=style)
+    theta, r_all = polar_coords_shared([spacing_elev_fb[key] for key in keys_fb], 'el', raw_max)
+    for r, (lbl, color, style) in zip(r_all, fb_styles):
+        ax_el.plot(theta, r, label=lbl, color=color, linestyle=style)
     ax_el.legend(loc='upper right', bbox_to_anchor=(1.2, 1.1))
     # Azimuth patterns
-    raw_max_az = max(max(p['gain'] for p in spacing_az_fb[f]) for f in keys_fb)
+    raw_max_az = max_gain(*(spacing_az_fb[f] for f in keys_fb))
     configure_polar_axes(ax_az, f'Azimuth Pattern (el=30°)', raw_max_az, zero_loc='E', direction=-1)
-    for idx, key in enumerate(keys_fb):
-        data = sorted(spacing_az_fb[key], key=lambda p: p['az'])
-        phi = np.radians([p['az'] for p in data])
-        r = [0.89 ** ((raw_max_az - p['gain']) / 2.0) for p in data]
-        style = '--' if key == 'dipole' else '-'
-        ax_az.plot(phi, r, label=labels_fb[idx], color=colors[idx % len(colors)], linestyle=style)
+    phi, r_all = polar_coords_shared([spacing_az_fb[key] for key in keys_fb], 'az', raw_max_az)
+    for r, (lbl, color, style) in zip(r_all, fb_styles):
+        ax_az.plot(phi, r, label=lbl, color=color, linestyle=style)
     ax_az.legend(loc='upper right', bbox_to_anchor=(1.2, 1.1))
     plt.tight_layout()
     plt.savefig(polar_fb_plot)
@@ -417,37 +466,61 @@ def main():
     report.add_plot('Front-to-Back Ratio vs Detune for Each Spacing Fraction', fb_detune_plot, parameters=f"frequency = {FREQ_MHZ} MHz; height = {HEIGHT_M:.2f} m (~0.5λ); ground = {GROUND}; segments = {SEGMENTS}; radius = {RADIUS} m; elevation = 30° (azimuth pattern)")
     plt.close()
 
-    # Baseline optimum detune for max F/B at nominal frequency
-    best_detune_spacing = {frac: det for frac, det in zip(spacing_subset, detune_fb_list)}
+    # Baseline optimum detune for max F/B at nominal frequency, together with the
+    # patterns and impedance already solved for that geometry above
+    best_detune_spacing = {
+        frac: {
+            'det': det,
+            'elev_pat': spacing_elev_fb[frac],
+            'az_pat': spacing_az_fb[frac],
+            'impedance': spacing_imp_fb[frac],
+        }
+        for frac, det in zip(spacing_subset, detune_fb_list)
+    }
     # === Rescaled element lengths to achieve X≈0 at 21 MHz ===
     rescale_spacings = [0.05, 0.075, 0.10]
 
-    def reactance_for_scale(scale, detune, spacing_m):
-        driven_len = resonant_dipole_length(FREQ_MHZ) * scale
-        refl_len = resonant_dipole_length(FREQ_MHZ / (1 + detune)) * scale
-        model_tmp = AntennaModel()
-        half_d = driven_len / 2
-        half_r = refl_len / 2
-        model_tmp.add_element(AntennaElement(
-            x1=0.0, y1=-half_d, z1=0.0, x2=0.0, y2=half_d, z2=0.0, segments=SEGMENTS, radius=RADIUS))
-        model_tmp.add_feedpoint(element_index=0, segment=center_seg)
-        model_tmp.add_element(AntennaElement(
-            x1=-spacing_m, y1=-half_r, z1=0.0, x2=-spacing_m, y2=half_r, z2=0.0, segments=SEGMENTS, radius=RADIUS))
-        R, X = sim.simulate_pattern(
-            model_tmp, FREQ_MHZ, height_m=HEIGHT_M, ground=GROUND, el_step=90.0, az_step=360.0
-        )['impedance']
+    # NEC solves dominate runtime and the passes below revisit the same geometries
+    # (bisection, detune search, comparison plots), so memoise them per geometry.
+    @functools.lru_cache(maxsize=4096)
+    def _cached_impedance(driven_len, refl_len, spacing_m):
+        model_tmp = build_scaled_yagi_model(driven_len, refl_len, spacing_m)
+        return sim.simulate_impedance(model_tmp, FREQ_MHZ, height_m=HEIGHT_M, ground=GROUND)
+
+    @functools.lru_cache(maxsize=4096)
+    def _cached_elev_pattern(driven_len, refl_len, spacing_m):
+        model_tmp = build_scaled_yagi_model(driven_len, refl_len, spacing_m)
+        return sim.simulate_pattern(
+            model_tmp, FREQ_MHZ, height_m=HEIGHT_M, ground=GROUND, el_step=5.0, az_step=360.0, return_format='structured'
+        )['pattern']
+
+    @functools.lru_cache(maxsize=4096)
+    def _cached_az_pattern(driven_len, refl_len, spacing_m, el, az_step):
+        model_tmp = build_scaled_yagi_model(driven_len, refl_len, spacing_m)
+        return sim.simulate_azimuth_pattern(
+            model_tmp, FREQ_MHZ, height_m=HEIGHT_M, ground=GROUND, el=el, az_step=az_step, return_format='structured'
+        )
+
+    def reactance_for_scale(scale, refl_unscaled, spacing_m):
+        driven_len = driven_length * scale
+        refl_len = refl_unscaled * scale
+        R, X = _cached_impedance(*_geometry_key(driven_len, refl_len, spacing_m))
         return X
 
+    # Pure in (detune, spacing); memoised so later passes can ask again for free
+    @functools.lru_cache(maxsize=None)
     def find_scale_factor(detune, spacing_m):
+        # Reflector length depends only on detune; compute it once, not per bisection step
+        refl_unscaled = resonant_dipole_length(FREQ_MHZ / (1 + detune))
         # Bracket search between 0.8 and 1.1
         low, high = 0.8, 1.1
-        X_low = reactance_for_scale(low, detune, spacing_m)
-        X_high = reactance_for_scale(high, detune, spacing_m)
+        X_low = reactance_for_scale(low, refl_unscaled, spacing_m)
+        X_high = reactance_for_scale(high, refl_unscaled, spacing_m)
         # Ensure sign change
         if X_low * X_high > 0:
             # expand range
             for s in np.linspace(0.6, 1.2, 13):
-                Xs = reactance_for_scale(s, detune, spacing_m)
+                Xs = reactance_for_scale(s, refl_unscaled, spacing_m)
                 if X_low * Xs <= 0:
                     high, X_high = s, Xs
                     break
@@ -457,7 +530,7 @@ def main():
         # Bisection
         for _ in range(20):
             mid = 0.5 * (low + high)
-            X_mid = reactance_for_scale(mid, detune, spacing_m)
+            X_mid = reactance_for_scale(mid, refl_unscaled, spacing_m)
             if abs(X_mid) < 0.1:
                 return mid, X_mid
             if X_low * X_mid <= 0:
@@ -469,75 +542,57 @@ def main():
     rescale_rows = []
     orig_rows = []
     pattern_compare_plots = []
+    # Scaled (X≈0) patterns per spacing, reused by the final comparison plots
+    compare_cache = {}
+    # One figure serves every comparison plot below; its axes are cleared per spacing
+    cmp_fig, (cmp_ax_el, cmp_ax_az) = plt.subplots(1, 2, subplot_kw={'polar': True}, figsize=(14, 7))
+    # Per-curve (label, color, linestyle) are the same for every spacing: resolve them once
+    cmp_styles = list(zip(['Original', 'Scaled'], colors, ['--', '-']))
     for frac in rescale_spacings:
-        det = best_detune_spacing[frac]
+        best = best_detune_spacing[frac]
+        det = best['det']
         spacing_m = frac * wavelength_m
-        # --- Original geometry impedance ---
-        orig_model_tmp = build_two_element_yagi_model(FREQ_MHZ, det, spacing_m)
-        R0, X0 = sim.simulate_pattern(orig_model_tmp, FREQ_MHZ, height_m=HEIGHT_M, ground=GROUND, el_step=90.0, az_step=360.0)['impedance']
-        driven_orig = resonant_dipole_length(FREQ_MHZ)
+        # --- Original geometry impedance (solved in the spacing-subset pass) ---
+        driven_orig = driven_length
         refl_orig = resonant_dipole_length(FREQ_MHZ / (1 + det))
+        R0, X0 = best['impedance']
         orig_rows.append([f"{frac:.3f}", f"{driven_orig:.3f}", f"{refl_orig:.3f}", f"{R0:.1f}", f"{X0:.1f}"])
         scale, x_final = find_scale_factor(det, spacing_m)
-        # original driven length and reflector length
-        driven_len = resonant_dipole_length(FREQ_MHZ)
-        refl_len = resonant_dipole_length(FREQ_MHZ / (1 + det))
-        new_driven = driven_len * scale
-        new_refl = refl_len * scale
-        # Build scaled model manually
-        model_scaled = AntennaModel()
-        half_d = new_driven / 2
-        half_r = new_refl / 2
-        model_scaled.add_element(AntennaElement(
-            x1=0.0, y1=-half_d, z1=0.0, x2=0.0, y2=half_d, z2=0.0, segments=SEGMENTS, radius=RADIUS))
-        model_scaled.add_feedpoint(element_index=0, segment=center_seg)
-        model_scaled.add_element(AntennaElement(
-            x1=-spacing_m, y1=-half_r, z1=0.0, x2=-spacing_m, y2=half_r, z2=0.0, segments=SEGMENTS, radius=RADIUS))
-        R,X = sim.simulate_pattern(
-            model_scaled, FREQ_MHZ, height_m=HEIGHT_M, ground=GROUND, el_step=90.0, az_step=360.0
-        )['impedance']
+        new_driven = driven_orig * scale
+        new_refl = refl_orig * scale
+        key_scaled = _geometry_key(new_driven, new_refl, spacing_m)
+        R, X = _cached_impedance(*key_scaled)
         rescale_rows.append([
             f"{frac:.3f}", f"{scale:.4f}", f"{new_driven:.3f}", f"{new_refl:.3f}", f"{R:.1f}", f"{X:.1f}"])
 
         # --- Pattern comparison plot ---
-        orig_model = build_two_element_yagi_model(FREQ_MHZ, det, spacing_m)
-        elev_orig = sim.simulate_pattern(orig_model, FREQ_MHZ, height_m=HEIGHT_M, ground=GROUND, el_step=5.0, az_step=360.0)['pattern']
-        az_orig = sim.simulate_azimuth_pattern(orig_model, FREQ_MHZ, height_m=HEIGHT_M, ground=GROUND, el=30.0, az_step=5.0)
-        elev_scaled = sim.simulate_pattern(model_scaled, FREQ_MHZ, height_m=HEIGHT_M, ground=GROUND, el_step=5.0, az_step=360.0)['pattern']
-        az_scaled = sim.simulate_azimuth_pattern(model_scaled, FREQ_MHZ, height_m=HEIGHT_M, ground=GROUND, el=30.0, az_step=5.0)
+        elev_orig = best['elev_pat']
+        az_orig = best['az_pat']
+        elev_scaled = _cached_elev_pattern(*key_scaled)
+        az_scaled = _cached_az_pattern(*key_scaled, 30.0, 5.0)
+        compare_cache[frac] = (elev_scaled, az_scaled)
 
         # Build plot
-        from antenna_model import configure_polar_axes
         comp_path = os.path.join('output/2_el_yagi_15m', f'pattern_compare_{int(frac*1000)}pl.png')
-        fig, (ax_el, ax_az) = plt.subplots(1, 2, subplot_kw={'polar': True}, figsize=(14,7))
-        colors = plt.rcParams['axes.prop_cycle'].by_key()['color']
+        fig, ax_el, ax_az = cmp_fig, cmp_ax_el, cmp_ax_az
+        ax_el.cla()
+        ax_az.cla()
         # Elevation
-        raw_max = max(
-            max(p['gain'] for p in elev_orig),
-            max(p['gain'] for p in elev_scaled)
-        )
+        raw_max = max_gain(elev_orig, elev_scaled)
         configure_polar_axes(ax_el, 'Elevation Pattern (az=0)', raw_max)
-        for idx, (data, lbl, style) in enumerate([(elev_orig,'Original','--'),(elev_scaled,'Scaled','-')]):
-            sorted_data = sorted(data, key=lambda p:p['el'])
-            theta=np.radians([p['el'] for p in sorted_data])
-            r=[0.89**((raw_max - p['gain'])/2.0) for p in sorted_data]
-            ax_el.plot(theta,r,label=lbl,color=colors[idx%len(colors)],linestyle=style)
+        theta, r_all = polar_coords_shared([elev_orig, elev_scaled], 'el', raw_max)
+        for r, (lbl, color, style) in zip(r_all, cmp_styles):
+            ax_el.plot(theta,r,label=lbl,color=color,linestyle=style)
         ax_el.legend(loc='upper right', bbox_to_anchor=(1.2,1.1))
         # Azimuth
-        raw_max_az = max(
-            max(p['gain'] for p in az_orig),
-            max(p['gain'] for p in az_scaled)
-        )
+        raw_max_az = max_gain(az_orig, az_scaled)
         configure_polar_axes(ax_az, 'Az Pattern (el=30°)', raw_max_az, zero_loc='E', direction=-1)
-        for idx,(data,lbl,style) in enumerate([(az_orig,'Original','--'),(az_scaled,'Scaled','-')]):
-            sorted_data=sorted(data,key=lambda p:p['az'])
-            phi=np.radians([p['az'] for p in sorted_data])
-            r=[0.89**((raw_max_az - p['gain'])/2.0) for p in sorted_data]
-            ax_az.plot(phi,r,label=lbl,color=colors[idx%len(colors)],linestyle=style)
+        phi, r_all = polar_coords_shared([az_orig, az_scaled], 'az', raw_max_az)
+        for r, (lbl, color, style) in zip(r_all, cmp_styles):
+            ax_az.plot(phi,r,label=lbl,color=color,linestyle=style)
         ax_az.legend(loc='upper right', bbox_to_anchor=(1.2,1.1))
-        plt.tight_layout()
-        plt.savefig(comp_path)
-        plt.close(fig)
+        fig.tight_layout()
+        fig.savefig(comp_path)
         report.add_plot(
             f'Pattern Comparison Original vs Scaled ({frac:.3f}λ)',
             comp_path,
@@ -560,123 +615,98 @@ def main():
 
     # === Optimised detune (scale fixed) to maximise F/B while |X| small ===
     opt_rows = []
-    for frac in rescale_spacings:
-        det_base = best_detune_spacing[frac]
-        spacing_m = frac * wavelength_m
-        scale_base, _ = find_scale_factor(det_base, spacing_m)
-        det_list = np.arange(det_base-0.02, det_base+0.0201, 0.005)  # ±2% in 0.5% steps
-        best_fb = -1e9
-        best_tuple = None
-        # Precompute driven element once
-        driven_len_sc = resonant_dipole_length(FREQ_MHZ) * scale_base
-        half_d_sc = driven_len_sc/2
-        for det in det_list:
-            refl_len_sc = resonant_dipole_length(FREQ_MHZ / (1+det)) * scale_base
-            half_r_sc = refl_len_sc/2
-            model_tmp = AntennaModel()
-            model_tmp.add_element(AntennaElement(x1=0,y1=-half_d_sc,z1=0,x2=0,y2=half_d_sc,z2=0,segments=SEGMENTS,radius=RADIUS))
-            model_tmp.add_feedpoint(element_index=0, segment=center_seg)
-            model_tmp.add_element(AntennaElement(x1=-spacing_m,y1=-half_r_sc,z1=0,x2=-spacing_m,y2=half_r_sc,z2=0,segments=SEGMENTS,radius=RADIUS))
-            # Quick impedance check
-            R_imp, X_imp = sim.simulate_pattern(model_tmp, FREQ_MHZ, height_m=HEIGHT_M, ground=GROUND, el_step=90.0, az_step=360.0)['impedance']
-            if abs(X_imp) > 5.0:
+    # One pool serves every spacing's detune search; workers keep their simulators warm
+    with Pool(processes=os.cpu_count(), initializer=_init_worker) as pool:
+        for frac in rescale_spacings:
+            det_base = best_detune_spacing[frac]['det']
+            spacing_m = frac * wavelength_m
+            scale_base, _ = find_scale_factor(det_base, spacing_m)
+            det_list = np.arange(det_base-0.02, det_base+0.0201, 0.005)  # ±2% in 0.5% steps
+            # Precompute driven element once; reflector lengths depend only on detune
+            driven_len_sc = driven_length * scale_base
+            refl_unscaled = resonant_dipole_length(FREQ_MHZ / (1 + det_list))
+            tasks = [
+                (scale_base, det, driven_len_sc, refl_unscaled[j] * scale_base, spacing_m)
+                for j, det in enumerate(det_list)
+            ]
+            # Coarse-to-fine: F/B vs detune is smooth, so solve every other point (1% steps)
+            # first and then only the 0.5% neighbours of the coarse winner. Falls back to
+            # the full grid when no coarse point meets the |X| limit.
+            # Assumes F/B is unimodal over the detunes that pass the |X| limit: a second
+            # peak at an unsolved 0.5% point away from the coarse winner would be missed,
+            # where the full 9-point scan would find it.
+            evaluated = [None] * len(tasks)
+            coarse_idx = list(range(0, len(tasks), 2))
+            # Each detune is an independent NEC solve; map keeps sweep order so ties resolve as before
+            for i, res in zip(coarse_idx, pool.map(_eval_det, [tasks[i] for i in coarse_idx])):
+                evaluated[i] = res
+            coarse_ok = [i for i in coarse_idx if evaluated[i] is not None]
+            if coarse_ok:
+                best_i = max(coarse_ok, key=lambda i: evaluated[i][4])
+                fine_idx = [i for i in (best_i - 1, best_i + 1) if 0 <= i < len(tasks)]
+            else:
+                fine_idx = [i for i in range(len(tasks)) if i not in coarse_idx]
+            for i, res in zip(fine_idx, pool.map(_eval_det, [tasks[i] for i in fine_idx])):
+                evaluated[i] = res
+            best_fb = -1e9
+            best_tuple = None
+            for res in evaluated:
+                if res is not None and res[4] > best_fb:
+                    best_fb = res[4]
+                    best_tuple = res
+            if best_tuple is None:
                 continue
-            # Fast azimuth pattern (0 & 180)
-            az_pat = sim.simulate_azimuth_pattern(model_tmp, FREQ_MHZ, height_m=HEIGHT_M, ground=GROUND, el=30.0, az_step=180.0)
-            fwd = next(p['gain'] for p in az_pat if abs(p['az'])<1e-3)
-            back = next(p['gain'] for p in az_pat if abs(p['az']-180.0)<1e-3)
-            fb_val = fwd - back
-            if fb_val > best_fb:
-                best_fb = fb_val
-                best_tuple = (scale_base, det, R_imp, X_imp, fb_val, fwd)
-        if best_tuple is None:
-            continue
-        sc_opt, det_opt, R_opt, X_opt, fb_opt, gain_opt = best_tuple
-        opt_rows.append([
-            f"{frac:.3f}", f"{sc_opt:.4f}", f"{det_opt*100:.2f}", f"{R_opt:.1f}", f"{X_opt:.1f}", f"{gain_opt:.2f}", f"{fb_opt:.2f}"])
+            sc_opt, det_opt, R_opt, X_opt, fb_opt, gain_opt = best_tuple
+            opt_rows.append([
+                f"{frac:.3f}", f"{sc_opt:.4f}", f"{det_opt*100:.2f}", f"{R_opt:.1f}", f"{X_opt:.1f}", f"{gain_opt:.2f}", f"{fb_opt:.2f}"])
 
     report.add_table(
         'Optimised Detune (Scale fixed, |X|≤5 Ω)',
         ['Spacing λ','Scale','Detune %','R (Ω)','X (Ω)','Gain (dBi)','F/B (dB)'],
         opt_rows,
-        parameters='Detune swept ±2% around baseline with scale fixed at zero-reactance value; forward/back cut uses az_step=180°.'
+        parameters='Detune searched ±2% around baseline (1% coarse steps, then 0.5% around the best) with scale fixed at zero-reactance value; forward/back cut uses az_step=180°.'
     )
 
     # --- Update pattern comparison plots to include optimised model ---
     opt_dict = {float(row[0]): (float(row[1]), float(row[2])/100.0) for row in opt_rows}
+    opt_styles = list(zip(['Original', 'Scaled', 'Optimized'], colors, ['--', '-.', '-']))
 
     for frac in rescale_spacings:
         if frac not in opt_dict:
             continue
         sc_opt, det_opt = opt_dict[frac]
         spacing_m = frac * wavelength_m
-        # Build models
-        # Original
-        det_orig = best_detune_spacing[frac]
-        model_orig = build_two_element_yagi_model(FREQ_MHZ, det_orig, spacing_m)
-        elev_orig = sim.simulate_pattern(model_orig, FREQ_MHZ, height_m=HEIGHT_M, ground=GROUND, el_step=5.0, az_step=360.0)['pattern']
-        az_orig = sim.simulate_azimuth_pattern(model_orig, FREQ_MHZ, height_m=HEIGHT_M, ground=GROUND, el=30.0, az_step=5.0)
-        # Scaled (reactance zero)
-        scale_zero, _ = find_scale_factor(det_orig, spacing_m)
-        driven_zero = resonant_dipole_length(FREQ_MHZ) * scale_zero
-        refl_zero = resonant_dipole_length(FREQ_MHZ / (1 + det_orig)) * scale_zero
-        half_dz, half_rz = driven_zero/2, refl_zero/2
-        model_zero = AntennaModel()
-        model_zero.add_element(AntennaElement(x1=0,y1=-half_dz,z1=0,x2=0,y2=half_dz,z2=0,segments=SEGMENTS,radius=RADIUS))
-        model_zero.add_feedpoint(element_index=0, segment=center_seg)
-        model_zero.add_element(AntennaElement(x1=-spacing_m,y1=-half_rz,z1=0,x2=-spacing_m,y2=half_rz,z2=0,segments=SEGMENTS,radius=RADIUS))
-        elev_zero = sim.simulate_pattern(model_zero, FREQ_MHZ, height_m=HEIGHT_M, ground=GROUND, el_step=5.0, az_step=360.0)['pattern']
-        az_zero = sim.simulate_azimuth_pattern(model_zero, FREQ_MHZ, height_m=HEIGHT_M, ground=GROUND, el=30.0, az_step=5.0)
+        # Original and scaled (reactance zero) were solved in earlier passes
+        elev_orig = best_detune_spacing[frac]['elev_pat']
+        az_orig = best_detune_spacing[frac]['az_pat']
+        elev_zero, az_zero = compare_cache[frac]
         # Optimized
-        driven_opt = resonant_dipole_length(FREQ_MHZ) * sc_opt
+        driven_opt = driven_length * sc_opt
         refl_opt = resonant_dipole_length(FREQ_MHZ / (1 + det_opt)) * sc_opt
-        half_do, half_ro = driven_opt/2, refl_opt/2
-        model_opt = AntennaModel()
-        model_opt.add_element(AntennaElement(x1=0,y1=-half_do,z1=0,x2=0,y2=half_do,z2=0,segments=SEGMENTS,radius=RADIUS))
-        model_opt.add_feedpoint(element_index=0, segment=center_seg)
-        model_opt.add_element(AntennaElement(x1=-spacing_m,y1=-half_ro,z1=0,x2=-spacing_m,y2=half_ro,z2=0,segments=SEGMENTS,radius=RADIUS))
-        elev_opt = sim.simulate_pattern(model_opt, FREQ_MHZ, height_m=HEIGHT_M, ground=GROUND, el_step=5.0, az_step=360.0)['pattern']
-        az_opt = sim.simulate_azimuth_pattern(model_opt, FREQ_MHZ, height_m=HEIGHT_M, ground=GROUND, el=30.0, az_step=5.0)
-
-        from antenna_model import configure_polar_axes
+        key_opt = _geometry_key(driven_opt, refl_opt, spacing_m)
+        elev_opt = _cached_elev_pattern(*key_opt)
+        az_opt = _cached_az_pattern(*key_opt, 30.0, 5.0)
+
         comp_path = os.path.join('output/2_el_yagi_15m', f'pattern_compare_{int(frac*1000)}pl.png')
-        fig, (ax_el, ax_az) = plt.subplots(1,2,subplot_kw={'polar':True}, figsize=(14,7))
-        colors = plt.rcParams['axes.prop_cycle'].by_key()['color']
+        fig, ax_el, ax_az = cmp_fig, cmp_ax_el, cmp_ax_az
+        ax_el.cla()
+        ax_az.cla()
         # Elevation
-        raw_max = max(
-            max(p['gain'] for p in elev_orig),
-            max(p['gain'] for p in elev_zero),
-            max(p['gain'] for p in elev_opt)
-        )
+        raw_max = max_gain(elev_orig, elev_zero, elev_opt)
         configure_polar_axes(ax_el,'Elevation Pattern (az=0)', raw_max)
-        for idx,(data,lbl,style) in enumerate([
-            (elev_orig,'Original','--'),
-            (elev_zero,'Scaled','-.'),
-            (elev_opt,'Optimized','-')]):
-            sorted_data=sorted(data,key=lambda p:p['el'])
-            theta=np.radians([p['el'] for p in sorted_data])
-            r=[0.89**((raw_max-p['gain'])/2.0) for p in sorted_data]
-            ax_el.plot(theta,r,label=lbl,color=colors[idx%len(colors)],linestyle=style)
+        theta, r_all = polar_coords_shared([elev_orig, elev_zero, elev_opt], 'el', raw_max)
+        for r, (lbl, color, style) in zip(r_all, opt_styles):
+            ax_el.plot(theta,r,label=lbl,color=color,linestyle=style)
         ax_el.legend(loc='upper right', bbox_to_anchor=(1.25,1.1))
         # Azimuth
-        raw_max_az = max(
-            max(p['gain'] for p in az_orig),
-            max(p['gain'] for p in az_zero),
-            max(p['gain'] for p in az_opt)
-        )
+        raw_max_az = max_gain(az_orig, az_zero, az_opt)
         configure_polar_axes(ax_az,'Az Pattern (el=30°)', raw_max_az, zero_loc='E', direction=-1)
-        for idx,(data,lbl,style) in enumerate([
-            (az_orig,'Original','--'),
-            (az_zero,'Scaled','-.'),
-            (az_opt,'Optimized','-')]):
-            sorted_data=sorted(data,key=lambda p:p['az'])
-            phi=np.radians([p['az'] for p in sorted_data])
-            r=[0.89**((raw_max_az-p['gain'])/2.0) for p in sorted_data]
-            ax_az.plot(phi,r,label=lbl,color=colors[idx%len(colors)],linestyle=style)
+        phi, r_all = polar_coords_shared([az_orig, az_zero, az_opt], 'az', raw_max_az)
+        for r, (lbl, color, style) in zip(r_all, opt_styles):
+            ax_az.plot(phi,r,label=lbl,color=color,linestyle=style)
         ax_az.legend(loc='upper right', bbox_to_anchor=(1.25,1.1))
-        plt.tight_layout()
-        plt.savefig(comp_path)
-        plt.close(fig)
+        fig.tight_layout()
+        fig.savefig(comp_path)
         # Update plot reference
         report.add_plot(
             f'Pattern Comparison Orig vs Scaled vs Opt ({frac:.3f}λ)',
@@ -684,6 +714,8 @@ def main():
             parameters=f'Optimised scale={sc_opt:.4f}, detune={det_opt*100:.2f}%'
         )
 
+    plt.close(cmp_fig)
+
     # Save report
     report.save()
 
@@ -14,6 +14,7 @@ from antenna_model import (
     compute_elevation_patterns,
     compute_azimuth_patterns,
     plot_polar_patterns,
+    gain_by_angle,
     Report,
 )
 
@@ -23,7 +24,7 @@ def main():
     args = parser.parse_args()
 
     lengths_ft = [66, 88, 96, 102]
-    lengths_m = [feet_to_meters(l) for l in lengths_ft]
+    lengths_m = feet_to_meters(lengths_ft).tolist()
     freqs_mhz = [3.5, 7.1]
     height_m = 10.0
     segments = 21
@@ -40,13 +41,15 @@ def main():
         for l_ft, l_m in zip(lengths_ft, lengths_m):
             seg_count = segments
             model = build_dipole_model(total_length=l_m, segments=seg_count, radius=radius)
-            # Feedpoint impedance
-            res = sim.simulate_pattern(model, freq_mhz=freq, height_m=height_m, ground=ground, el_step=5, az_step=360)
+            # Feedpoint impedance and elevation pattern come from the same solve
+            res = sim.simulate_pattern(model, freq_mhz=freq, height_m=height_m, ground=ground, el_step=5, az_step=360,
+                                       return_format='structured')
             R, X = res['impedance']
             imp_rows.append([f"{l_ft}'", f"{l_m:.2f}", f"{R:.2f}", f"{X:.2f}"])
             # Elevation and azimuth patterns
-            el_pat = sim.simulate_pattern(model, freq_mhz=freq, height_m=height_m, ground=ground, el_step=5, az_step=360)['pattern']
-            az_pat = sim.simulate_azimuth_pattern(model, freq, height_m=height_m, ground=ground, el=30.0, az_step=5.0)
+            el_pat = res['pattern']
+            az_pat = sim.simulate_azimuth_pattern(model, freq, height_m=height_m, ground=ground, el=30.0, az_step=5.0,
+                                                  return_format='structured')
             el_pats[l_ft] = el_pat
             az_pats[l_ft] = az_pat
         # Table: Feedpoint impedance
@@ -60,17 +63,24 @@ def main():
         el_angles = list(range(0, 181, 5))
         headers = ['Elevation (deg)'] + [f"{l_ft}'" for l_ft in lengths_ft]
         rows = []
+        el_gains = {
+            l_ft: gain_by_angle(el_pats[l_ft][np.abs(el_pats[l_ft]['az']) < 1e-6], 'el')
+            for l_ft in lengths_ft
+        }
+        # Build rows and track the (displayed) peak per column in the same pass
+        peaks = [None] * len(lengths_ft)
         for el in el_angles:
             row = [el]
-            for l_ft in lengths_ft:
-                val = next((p['gain'] for p in el_pats[l_ft] if abs(p['el'] - el) < 1e-6 and abs(p['az']) < 1e-6), '')
-                row.append(f"{val:.3f}" if val != '' else '')
+            for j, l_ft in enumerate(lengths_ft):
+                val = el_gains[l_ft].get(el)
+                if val is None:
+                    row.append('')
+                    continue
+                cell = f"{val:.3f}"
+                row.append(cell)
+                if peaks[j] is None or float(cell) > peaks[j]:
+                    peaks[j] = float(cell)
             rows.append(row)
-        # Bold peak gain per column
-        peaks = []
-        for col in range(1, len(headers)):
-            col_vals = [float(r[col]) for r in rows if r[col] != '']
-            peaks.append(max(col_vals) if col_vals else None)
         formatted_rows = []
         for r in rows:
             fr = [r[0]]
@@ -90,11 +100,12 @@ def main():
         az_headers = ['Azimuth (deg)'] + [f"{l_ft}'" for l_ft in lengths_ft]
         az_rows = []
         # assume all patterns share the same azimuth angles
-        az_angles = [p['az'] for p in az_pats[lengths_ft[0]]]
+        az_angles = az_pats[lengths_ft[0]]['az'].tolist()
+        az_gains = {l_ft: gain_by_angle(az_pats[l_ft]) for l_ft in lengths_ft}
         for az in az_angles:
             row = [az]
             for l_ft in lengths_ft:
-                g = next((p['gain'] for p in az_pats[l_ft] if abs(p['az'] - az) < 1e-6), None)
+                g = az_gains[l_ft].get(round(az, 3))
                 row.append(f"{g:.3f}" if g is not None else '')
             az_rows.append(row)
         report.add_table(
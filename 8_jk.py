@@ -18,6 +18,9 @@ from antenna_model import (
     compute_elevation_patterns,
     compute_azimuth_patterns,
     plot_polar_patterns,
+    gain_by_angle,
+    max_gain,
+    polar_coords_shared,
     configure_polar_axes,
     Report,
     resonant_dipole_length,
@@ -33,10 +36,31 @@ two_el_yagi = importlib.util.module_from_spec(spec)
 spec.loader.exec_module(two_el_yagi)
 build_two_element_yagi_model = two_el_yagi.build_two_element_yagi_model
 
+def elevation_gain_rows(el_pats, heights, el_angles):
+    """Formatted elevation-vs-height gain rows, with each height's peak in bold."""
+    el_gains = {h: gain_by_angle(el_pats[h], 'el') for h in heights}
+    peaks = {h: max(el_gains[h].get(el, -np.inf) for el in el_angles) for h in heights}
+    rows = []
+    for el in el_angles:
+        row = [el]
+        for h in heights:
+            val = el_gains[h].get(el)
+            if val is None:
+                row.append('')
+            elif abs(val - peaks[h]) < 1e-6:
+                row.append(f"**{val:.3f}**")
+            else:
+                row.append(f"{val:.3f}")
+        rows.append(row)
+    return rows
+
 def main():
     parser = argparse.ArgumentParser(description="8JK antenna pattern analysis and plotting.")
     parser.add_argument('--show-gui', action='store_true', help='Show plots interactively instead of saving')
     args = parser.parse_args()
+    if not args.show_gui:
+        # Batch mode only writes PNGs; skip interactive backend setup
+        plt.switch_backend('Agg')
 
     # Simulation setup
     freq_mhz = 14.1
@@ -107,57 +131,19 @@ def main():
     report.add_table('Feedpoint Impedance vs Height (8JK - 0.5 wl)', ['Height (m)', 'R (Ω)', 'X (Ω)'], imp_list_hw, parameters="frequency = 14.1 MHz; element_length = 0.5 λ; spacing = 6.0 m (~0.30 λ); phasing = 180° out-of-phase; segments = 21; radius = 0.001 m; ground = average; heights = [5.0, 10.0, 15.0, 20.0] m")
 
     # 2) Elevation patterns and gain table (44' elements)
-    el_pats = compute_elevation_patterns(sim, model, freq_mhz, heights, ground)
+    el_pats = compute_elevation_patterns(sim, model, freq_mhz, heights, ground, return_format='structured')
     el_angles = list(range(0, 181, 5))
     headers = ['Elevation (deg)'] + [f'{h:.1f} m' for h in heights]
-    rows = []
-    for el in el_angles:
-        vals = [next((p['gain'] for p in el_pats[h] if abs(p['el'] - el) < 1e-6), '') for h in heights]
-        rows.append([el] + vals)
-    # Bold peak gain per column
-    peaks = []
-    for col in range(1, len(headers)):
-        col_vals = [r[col] for r in rows if isinstance(r[col], (int, float))]
-        peaks.append(max(col_vals) if col_vals else None)
-    formatted_rows = []
-    for r in rows:
-        fr = [r[0]]
-        for idx, val in enumerate(r[1:], start=1):
-            if isinstance(val, (int, float)) and peaks[idx-1] is not None and abs(val - peaks[idx-1]) < 1e-6:
-                fr.append(f"**{val:.3f}**")
-            elif isinstance(val, (int, float)):
-                fr.append(f"{val:.3f}")
-            else:
-                fr.append('')
-        formatted_rows.append(fr)
+    formatted_rows = elevation_gain_rows(el_pats, heights, el_angles)
     report.add_table('Gain at az=0 for Elevation 0–180° (8JK - 44\')', headers, formatted_rows, parameters="frequency = 14.1 MHz; element_length = 44 ft; spacing = 6.0 m (~0.30 λ); phasing = 180° out-of-phase; segments = 21; radius = 0.001 m; ground = average; heights = [5.0, 10.0, 15.0, 20.0] m; azimuth = 0°")
     # 2a) Elevation patterns and gain table (8JK - 0.5 wl)
-    el_pats_hw = compute_elevation_patterns(sim, model_half, freq_mhz, heights, ground)
-    rows_hw = []
-    for el in el_angles:
-        vals = [next((p['gain'] for p in el_pats_hw[h] if abs(p['el'] - el) < 1e-6), '') for h in heights]
-        rows_hw.append([el] + vals)
-    # Bold peaks per height for half-wave
-    peaks_hw = []
-    for col in range(1, len(headers)):
-        col_vals = [r[col] for r in rows_hw if isinstance(r[col], (int, float))]
-        peaks_hw.append(max(col_vals) if col_vals else None)
-    formatted_hw = []
-    for r in rows_hw:
-        fr = [r[0]]
-        for idx, val in enumerate(r[1:], start=1):
-            if isinstance(val, (int, float)) and peaks_hw[idx-1] is not None and abs(val - peaks_hw[idx-1]) < 1e-6:
-                fr.append(f"**{val:.3f}**")
-            elif isinstance(val, (int, float)):
-                fr.append(f"{val:.3f}")
-            else:
-                fr.append('')
-        formatted_hw.append(fr)
+    el_pats_hw = compute_elevation_patterns(sim, model_half, freq_mhz, heights, ground, return_format='structured')
+    formatted_hw = elevation_gain_rows(el_pats_hw, heights, el_angles)
     report.add_table('Gain at az=0 for Elevation 0–180° (8JK - 0.5 wl)', headers, formatted_hw, parameters="frequency = 14.1 MHz; element_length = 0.5 λ; spacing = 6.0 m (~0.30 λ); phasing = 180° out-of-phase; segments = 21; radius = 0.001 m; ground = average; heights = [5.0, 10.0, 15.0, 20.0] m; azimuth = 0°")
 
     # 3) Azimuth patterns at fixed elevation
     el_fixed = 30.0
-    az_pats = compute_azimuth_patterns(sim, model, freq_mhz, heights, ground, el=el_fixed)
+    az_pats = compute_azimuth_patterns(sim, model, freq_mhz, heights, ground, el=el_fixed, return_format='structured')
 
     # 4) Polar patterns plot (44' elements)
     output_file = os.path.join(report.report_dir, '8_jk_pattern.png')
@@ -165,7 +151,7 @@ def main():
     report.add_plot('Azimuth and Elevation Patterns (8JK - 44\')', output_file, parameters="frequency = 14.1 MHz; element_length = 44 ft; spacing = 6.0 m (~0.30 λ); phasing = 180° out-of-phase; segments = 21; radius = 0.001 m; ground = average; heights = [5.0, 10.0, 15.0, 20.0] m; elevation = 30°")
     # 4a) Polar patterns plot for half-wave model
     el_pats_hw = el_pats_hw
-    az_pats_hw = compute_azimuth_patterns(sim, model_half, freq_mhz, heights, ground, el=el_fixed)
+    az_pats_hw = compute_azimuth_patterns(sim, model_half, freq_mhz, heights, ground, el=el_fixed, return_format='structured')
     output_hw = os.path.join(report.report_dir, '8_jk_pattern_05wl.png')
     plot_polar_patterns(el_pats_hw, az_pats_hw, heights, el_fixed, output_hw, args.show_gui)
     report.add_plot('Azimuth and Elevation Patterns (8JK - 0.5 wl)', output_hw, parameters="frequency = 14.1 MHz; element_length = 0.5 λ; spacing = 6.0 m (~0.30 λ); phasing = 180° out-of-phase; segments = 21; radius = 0.001 m; ground = average; heights = [5.0, 10.0, 15.0, 20.0] m; elevation = 30°")
@@ -173,62 +159,40 @@ def main():
     # 5) Comparison with dipole and Yagi at h=10m
     cmp_height = 10.0
     cmp_heights = [cmp_height]
-    # Patterns for 44' 8JK
-    jk_el_cmp = compute_elevation_patterns(sim, model, freq_mhz, cmp_heights, ground)[cmp_height]
-    jk_az_cmp = compute_azimuth_patterns(sim, model, freq_mhz, cmp_heights, ground, el=el_fixed)[cmp_height]
+    # Patterns for 44' 8JK (cmp_height is one of the heights already swept above)
+    jk_el_cmp = el_pats[cmp_height]
+    jk_az_cmp = az_pats[cmp_height]
     # Patterns for 0.5 wl dipole
     dip05 = build_dipole_model(total_length=resonant_dipole_length(freq_mhz), segments=segments, radius=radius)
-    dip05_el = compute_elevation_patterns(sim, dip05, freq_mhz, cmp_heights, ground)[cmp_height]
-    dip05_az = compute_azimuth_patterns(sim, dip05, freq_mhz, cmp_heights, ground, el=el_fixed)[cmp_height]
+    dip05_el = compute_elevation_patterns(sim, dip05, freq_mhz, cmp_heights, ground, return_format='structured')[cmp_height]
+    dip05_az = compute_azimuth_patterns(sim, dip05, freq_mhz, cmp_heights, ground, el=el_fixed, return_format='structured')[cmp_height]
     # Patterns for 2-element Yagi (6% detune, 0.3 wl spacing)
     yagi_model = build_two_element_yagi_model(freq_mhz, segments, radius, detune_frac=0.06, spacing_frac=0.3)
-    yagi_el = compute_elevation_patterns(sim, yagi_model, freq_mhz, cmp_heights, ground)[cmp_height]
-    yagi_az = compute_azimuth_patterns(sim, yagi_model, freq_mhz, cmp_heights, ground, el=el_fixed)[cmp_height]
+    yagi_el = compute_elevation_patterns(sim, yagi_model, freq_mhz, cmp_heights, ground, return_format='structured')[cmp_height]
+    yagi_az = compute_azimuth_patterns(sim, yagi_model, freq_mhz, cmp_heights, ground, el=el_fixed, return_format='structured')[cmp_height]
 
     # Combined comparison polar plot: 8JK 44', 8JK 0.5 wl, Dipole 0.5 wl, Yagi (6%,0.3 wl)
     fig, (ax_el_cmp, ax_az_cmp) = plt.subplots(1, 2, subplot_kw={'polar': True}, figsize=(14, 7))
     # Prepare patterns
     jk44_el = jk_el_cmp; jk44_az = jk_az_cmp
     jk05_el = el_pats_hw[cmp_height]
-    jk05_az = compute_azimuth_patterns(sim, model_half, freq_mhz, [cmp_height], ground, el=el_fixed)[cmp_height]
+    jk05_az = az_pats_hw[cmp_height]
     dip05_el = dip05_el; dip05_az = dip05_az
     yagi_el = yagi_el; yagi_az = yagi_az
     # Elevation comparison
-    raw_max_el_all = max(
-        max(p['gain'] for p in jk44_el),
-        max(p['gain'] for p in jk05_el),
-        max(p['gain'] for p in dip05_el),
-        max(p['gain'] for p in yagi_el),
-    )
+    raw_max_el_all = max_gain(jk44_el, jk05_el, dip05_el, yagi_el)
     configure_polar_axes(ax_el_cmp, 'Elevation Comparison (az=0)', raw_max_el_all)
-    for label, pat in [
-        ("8JK - 44'", jk44_el),
-        ("8JK - 0.5 wl", jk05_el),
-        ("Dipole - 0.5 wl", dip05_el),
-        ("Yagi (6%,0.3 wl)", yagi_el),
-    ]:
-        data = sorted(pat, key=lambda p: p['el'])
-        theta = np.radians([p['el'] for p in data])
-        r = [0.89 ** ((raw_max_el_all - p['gain']) / 2.0) for p in data]
+    cmp_labels = ["8JK - 44'", "8JK - 0.5 wl", "Dipole - 0.5 wl", "Yagi (6%,0.3 wl)"]
+    # All four cuts share one angle grid, so radii come from a single array expression
+    theta, r_all = polar_coords_shared([jk44_el, jk05_el, dip05_el, yagi_el], 'el', raw_max_el_all)
+    for label, r in zip(cmp_labels, r_all):
         ax_el_cmp.plot(theta, r, label=label)
     ax_el_cmp.legend(loc='upper right', bbox_to_anchor=(1.2, 1.1))
     # Azimuth comparison
-    raw_max_az_all = max(
-        max(p['gain'] for p in jk44_az),
-        max(p['gain'] for p in jk05_az),
-        max(p['gain'] for p in dip05_az),
-        max(p['gain'] for p in yagi_az),
-    )
+    raw_max_az_all = max_gain(jk44_az, jk05_az, dip05_az, yagi_az)
     configure_polar_axes(ax_az_cmp, f'Azimuth Comparison (el={int(el_fixed)}°)', raw_max_az_all, direction=-1)
-    for label, pat in [
-        ("8JK - 44'", jk44_az),
-        ("8JK - 0.5 wl", jk05_az),
-        ("Dipole - 0.5 wl", dip05_az),
-        ("Yagi (6%,0.3 wl)", yagi_az),
-    ]:
-        data = sorted(pat, key=lambda p: p['az'])
-        phi = np.radians([p['az'] for p in data])
-        r = [0.89 ** ((raw_max_az_all - p['gain']) / 2.0) for p in data]
+    phi, r_all = polar_coords_shared([jk44_az, jk05_az, dip05_az, yagi_az], 'az', raw_max_az_all)
+    for label, r in zip(cmp_labels, r_all):
         ax_az_cmp.plot(phi, r, label=label)
     ax_az_cmp.legend(loc='upper right', bbox_to_anchor=(1.2, 1.1))
     plt.tight_layout()
@@ -236,16 +200,18 @@ def main():
     if args.show_gui:
         plt.show()
     else:
-        plt.savefig(output_comb)
+        fig.savefig(output_comb)
+        plt.close(fig)
     report.add_plot("8JK vs Dipole vs Yagi Comparison", output_comb, parameters="frequency = 14.1 MHz; height = 10.0 m; spacing = 6.0 m (~0.30 λ); elevation = 30°; models = [8JK-44' (spacing=6.0 m (~0.30 λ), phasing=180°), 8JK-0.5λ (spacing=6.0 m (~0.30 λ), phasing=180°), Dipole-0.5λ, Yagi (detune=6%, spacing=0.30λ)]; segments = 21; radius = 0.001 m; ground = average")
 
     # 6) Forward gain table at elevation 15°–35° in 5° steps
     fwd_els = list(range(15, 36, 5))
     fwd_rows = []
+    fwd_gains = [gain_by_angle(pat, 'el') for pat in [jk44_el, jk05_el, dip05_el, yagi_el]]
     for el in fwd_els:
         row = [el]
-        for pat in [jk44_el, jk05_el, dip05_el, yagi_el]:
-            gain = next(p['gain'] for p in pat if abs(p['el'] - el) < 1e-6)
+        for gains in fwd_gains:
+            gain = gains[el]
             row.append(f"{gain:.3f}")
         fwd_rows.append(row)
     fwd_headers = ["Elevation (deg)", "8JK - 44'", "8JK - 0.5 wl", "Dipole - 0.5 wl", "Yagi (6%,0.3 wl)"]
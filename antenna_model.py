@@ -1,25 +1,61 @@
 import subprocess
-from typing import List, Dict, Any, Optional, Tuple
+import hashlib
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Tuple, Iterable, Sequence, Union
 import math
 import re
-import matplotlib.pyplot as plt
 import numpy as np
 import os
-import shutil
+import io
+import pickle
+import tempfile
+import warnings
+from collections import OrderedDict, deque
+from functools import lru_cache
+from itertools import islice
 
-def feet_to_meters(feet: float) -> float:
-    """Convert feet to meters."""
-    return feet * 0.3048
+# pymininec's Python package; when importable, solves run in-process instead of via the CLI
+try:
+    from mininec import mininec as _mininec
+except ImportError:  # pragma: no cover - CLI-only installs
+    _mininec = None
 
-def meters_to_feet(meters: float) -> float:
-    """Convert meters to feet."""
-    return meters / 0.3048
+# pyplot costs a few hundred ms to import; only the plotting helpers load it
+if TYPE_CHECKING:  # pragma: no cover
+    import matplotlib.pyplot as plt
+
+def _as_operand(x: Any) -> Any:
+    # Lists and tuples become float64 arrays so the unit helpers broadcast over them;
+    # scalars and arrays pass through unchanged
+    return np.asarray(x, dtype=np.float64) if isinstance(x, (list, tuple)) else x
+
+def feet_to_meters(feet: Any) -> Any:
+    """Convert feet to meters (elementwise for a list, tuple or array)."""
+    return _as_operand(feet) * 0.3048
+
+def meters_to_feet(meters: Any) -> Any:
+    """Convert meters to feet (elementwise for a list, tuple or array)."""
+    return _as_operand(meters) / 0.3048
+
+@lru_cache(maxsize=64)
+def _format_voltage(real: float, imag: float) -> str:
+    # --excitation-voltage value: "a" when the imaginary part is zero, else "a+bj" / "a-bj".
+    # Sweeps rebuild models with the same few voltages, so the strings are memoised.
+    if abs(imag) < 1e-12:
+        return f"{real:g}"
+    sign = '+' if imag >= 0 else ''
+    return f"{real:g}{sign}{imag:g}j"
 
 # Define a generic antenna element (straight wire)
 class AntennaElement:
     """
     Represents a straight wire segment in 3D space with specified geometry, segmentation, and radius.
     """
+    # Fixed attribute set: no per-instance __dict__, and attribute reads in the wire templates
+    # and cache keys go straight to the slot
+    __slots__ = ('x1', 'y1', 'z1', 'x2', 'y2', 'z2', 'segments', 'radius')
+
     def __init__(self,
                  x1: float, y1: float, z1: float,
                  x2: float, y2: float, z2: float,
@@ -56,10 +92,23 @@ class AntennaModel:
         self.elements: List[AntennaElement] = []
         # List of feedpoint definitions as dicts {'element_index': int, 'segment': int}
         self.feedpoints: List[Dict[str, int]] = []
+        # Pre-formatted -w pieces per element, built on first use (see to_pymininec_args)
+        self._wire_templates: Optional[List[Tuple[str, float, str, float, str]]] = None
+        # Formatted excitation args, built on first use (see _feed_args)
+        self._feed_arg_cache: Optional[List[str]] = None
+        # Memoised cache_key() / fingerprint(), cleared whenever elements or feedpoints are added
+        self._key: Optional[Tuple] = None
+        self._fingerprint: Optional[str] = None
+        # (N, 6) x1, y1, z1, x2, y2, z2 array behind the coords property, built on first use
+        self._coords: Optional[np.ndarray] = None
 
     def add_element(self, element: AntennaElement) -> None:
         """Add an antenna element (straight wire) to the model."""
         self.elements.append(element)
+        self._wire_templates = None
+        self._key = None
+        self._fingerprint = None
+        self._coords = None
 
     def add_feedpoint(self, element_index: int, segment: int, voltage: complex = 1+0j) -> None:
         """Add a feedpoint on the specified element/segment with a complex excitation voltage (real+imag)."""
@@ -68,22 +117,119 @@ class AntennaModel:
             'segment': segment,
             'voltage': voltage,
         })
+        self._feed_arg_cache = None
+        self._key = None
+        self._fingerprint = None
+
+    def with_element(self, index: int, element: AntennaElement) -> 'AntennaModel':
+        """Return a copy of this model with element `index` replaced; other elements are shared."""
+        model = AntennaModel()
+        model.elements = list(self.elements)
+        model.elements[index] = element
+        model._wire_templates = None
+        model.feedpoints = [dict(fp) for fp in self.feedpoints]
+        return model
+
+    def cache_key(self) -> Tuple:
+        """
+        Hashable snapshot of the geometry and feeds, for memoising results per model.
+        Models are mutable, so this is a method rather than __hash__; it is built once and
+        reused until add_element/add_feedpoint change the model.
+        """
+        if self._key is None:
+            self._key = (
+                tuple((e.x1, e.y1, e.z1, e.x2, e.y2, e.z2, e.segments, e.radius) for e in self.elements),
+                tuple((fp['element_index'], fp['segment'], fp.get('voltage', 1 + 0j)) for fp in self.feedpoints),
+            )
+        return self._key
+
+    def fingerprint(self) -> str:
+        """
+        Short hex digest of cache_key(): a compact, process-independent identity for keying
+        memoised results (unlike hash(), it is stable across runs). Reused until the model changes.
+        """
+        if self._fingerprint is None:
+            self._fingerprint = hashlib.blake2b(repr(self.cache_key()).encode(), digest_size=16).hexdigest()
+        return self._fingerprint
+
+    def is_symmetric_about_yz(self) -> bool:
+        """
+        True if every wire lies in the x=0 plane (e.g. a dipole along y). Such a model is its own
+        mirror image under x -> -x, so its az=180 cut is identical to its az=0 cut.
+        """
+        return bool(self.elements) and not self.coords[:, [0, 3]].any()
+
+    @property
+    def coords(self) -> np.ndarray:
+        """
+        Element end points as a read-only (N, 6) float64 array of x1, y1, z1, x2, y2, z2 rows,
+        for vectorised geometry work. Built once and reused until add_element is called.
+        """
+        if self._coords is None:
+            coords = np.array([(e.x1, e.y1, e.z1, e.x2, e.y2, e.z2) for e in self.elements],
+                              dtype=np.float64).reshape(-1, 6)
+            coords.flags.writeable = False
+            self._coords = coords
+        return self._coords
 
     @property
     def wires(self) -> List[Dict[str, Any]]:
         """Flatten elements into wire definitions suitable for pymininec."""
         return [e.to_wire_dict() for e in self.elements]
 
+    def _build_wire_templates(self) -> List[Tuple[str, float, str, float, str]]:
+        # Everything but the height-shifted z values is fixed per element. Formatted straight
+        # from the element (no to_wire_dict round-trip); z is rounded to 6 decimals, the same
+        # value float(f"{z:.6f}") gives, so the command line matches the wire dict.
+        templates = []
+        for e in self.elements:
+            templates.append((
+                f"{e.segments},{e.x1:.6f},{e.y1:.6f},",
+                round(e.z1, 6),
+                f",{e.x2:.6f},{e.y2:.6f},",
+                round(e.z2, 6),
+                f",{e.radius:.6f}",
+            ))
+        return templates
+
+    def _feed_args(self) -> List[str]:
+        # If explicit feedpoints are present on the model, generate a matching pair of
+        #   --excitation-pulse=<pulse,tag>  and  --excitation-voltage=<real,imag>
+        #   for each feedpoint. Formatted once and reused until feedpoints change.
+        if self._feed_arg_cache is not None:
+            return self._feed_arg_cache
+        args: List[str] = []
+        for fp in self.feedpoints:
+            # Auto-assigned wire tags start at 1 in the order the elements were
+            # added, so tag = element_index + 1
+            tag = fp["element_index"] + 1
+            segment = fp["segment"]
+            # A wire with N segments contains N-1 pulses.  A pulse number of P
+            # refers to the junction between segment P and P+1, so feeding *in*
+            # segment *segment* means using pulse = segment-1.  This matches the
+            # convention used by the original MININEC CLI and the earlier hard-
+            # coded default ("10,1") that fed the centre segment of a 21-segment
+            # dipole.
+            pulse = max(segment - 1, 1)
+            v: complex = fp.get("voltage", 1 + 0j)
+            args.extend(("--excitation-pulse", f"{pulse},{tag}",
+                         "--excitation-voltage", _format_voltage(v.real, v.imag)))
+        self._feed_arg_cache = args
+        return args
+
     def to_pymininec_args(self, height_m: float = 0.0) -> List[str]:
-        args = []
-        for w in self.wires:
-            # Apply height offset to z1, z2
-            z1 = float(w['z1']) + height_m
-            z2 = float(w['z2']) + height_m
-            args += [
-                "-w",
-                f"{w['segments']},{w['x1']},{w['y1']},{z1:.6f},{w['x2']},{w['y2']},{z2:.6f},{w['radius']}"
-            ]
+        # Elements are treated as fixed once added (with_element shares them between models),
+        # so the formatted wire pieces are reused across heights.
+        if self._wire_templates is None:
+            self._wire_templates = self._build_wire_templates()
+        templates = self._wire_templates
+        # Every other slot is the "-w" flag; fill the wire specs in with one slice assignment
+        args = ["-w"] * (2 * len(templates))
+        # Apply height offset to z1, z2
+        args[1::2] = [
+            f"{head}{z1 + height_m:.6f}{mid}{z2 + height_m:.6f}{tail}"
+            for head, z1, mid, z2, tail in templates
+        ]
         return args
 
 def build_dipole_model(
@@ -110,101 +256,354 @@ def build_dipole_model(
     model.add_feedpoint(element_index=0, segment=center_seg)
     return model
 
-def resonant_dipole_length(freq_mhz: float) -> float:
+def resonant_dipole_length(freq_mhz: Any) -> Any:
     """
     Return the ARRL handbook resonant half-wave dipole length (meters) for a given frequency (MHz):
     length = (468 / freq_mhz) [ft] converted to meters
     This formula accounts for typical end effects and is more accurate for real wire antennas than the ideal physics formula.
+    A list, tuple or array of frequencies gives an array of lengths.
     """
-    length_ft = 468 / freq_mhz
+    length_ft = 468 / _as_operand(freq_mhz)
     return feet_to_meters(length_ft)
 
+# Banner line (between runs of asterisks) that introduces the far-field table; a plain
+# substring, so str.find locates it without any regex machinery
+_PATTERN_HEADER = 'PATTERN DATA'
+# 'IMPEDANCE = ( R , X J)'. Both numeric groups are single character classes bounded by
+# literal delimiters, so a near-miss fails without backtracking.
+_IMPEDANCE_RE = re.compile(r"IMPEDANCE = \( *([-+.\deE]+) *, *([-+.\deE]+) *J\)")
+
+# Cheap substring pre-check for line-at-a-time scanning
+_IMPEDANCE_TAG = 'IMPEDANCE = ('
+
 def parse_impedance(output: str) -> Optional[Tuple[float, float]]:
-    # Look for 'IMPEDANCE = ( R , X J)'
-    m = re.search(r"IMPEDANCE = \( *([-.\deE]+) *, *([-.\deE]+) *J\)", output)
+    # Source data precedes the pattern table, so the compiled search stops well before it
+    m = _IMPEDANCE_RE.search(output)
     if m:
         R = float(m.group(1))
         X = float(m.group(2))
         return (R, X)
     return None
 
-def parse_pattern(output: str) -> List[Dict[str, float]]:
+# Structured (el, az, gain) record used for array-valued patterns
+PATTERN_DTYPE = np.dtype([('el', 'f8'), ('az', 'f8'), ('gain', 'f8')])
+# Half-size variant for large grids; float32 still resolves pymininec's 0.001 dB print
+PATTERN_DTYPE32 = np.dtype([('el', 'f4'), ('az', 'f4'), ('gain', 'f4')])
+# Any return_format of a pattern: list of {'el', 'az', 'gain'} dicts, a PATTERN_DTYPE /
+# PATTERN_DTYPE32 array, or a dict of 'el'/'az'/'gain' arrays ('soa')
+PatternLike = Union[List[Dict[str, float]], np.ndarray, Dict[str, np.ndarray]]
+
+def _pattern_as(records: np.ndarray, return_format: str) -> Any:
+    # Render a PATTERN_DTYPE array as a list of dicts (default), as a dict of contiguous
+    # 'el'/'az'/'gain' float64 arrays ('soa'), as a PATTERN_DTYPE32 array ('structured32'),
+    # or leave it structured
+    if return_format == 'structured':
+        return records
+    if return_format == 'structured32':
+        return records.astype(PATTERN_DTYPE32)
+    if return_format == 'dicts':
+        return [{'el': el, 'az': az, 'gain': g} for el, az, g in records.tolist()]
+    if return_format == 'soa':
+        return {name: np.ascontiguousarray(records[name]) for name in PATTERN_DTYPE.names}
+    raise ValueError(f"Unknown return_format: {return_format!r}")
+
+def _is_columnar(pattern: Any) -> bool:
+    # Structured arrays and 'soa' dicts both index columns by name
+    return isinstance(pattern, (np.ndarray, dict))
+
+def _pattern_len(pattern: Any) -> int:
+    return len(pattern['gain']) if isinstance(pattern, dict) else len(pattern)
+
+_NUM = r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?"
+# One pattern row: zenith, azimuth, vertical_db, horizontal_db, total_db[, ...]
+_PATTERN_ROW_RE = re.compile(
+    rf"^[ \t]*({_NUM})[ \t]+({_NUM})[ \t]+\S+[ \t]+\S+[ \t]+({_NUM})(?:[ \t]+\S+)*[ \t]*$",
+    re.M,
+)
+
+def _parse_pattern_block(block: str) -> np.ndarray:
+    # Parse the numeric rows of a pattern table into a PATTERN_DTYPE array
+    values = np.empty((0, 3))
+    if block.strip():
+        try:
+            # The whole numeric table in one C-level parse
+            values = np.loadtxt(io.StringIO(block), usecols=(0, 1, 4), ndmin=2)
+        except ValueError:
+            # Irregular table: keep only the well-formed rows
+            values = np.array(_PATTERN_ROW_RE.findall(block), dtype=np.float64).reshape(-1, 3)
+    pattern = np.empty(len(values), dtype=PATTERN_DTYPE)
+    # Convert zenith angle (0=up) to elevation (0–180 horizon-to-horizon)
+    el_offset = 90.0 - values[:, 0]
+    pattern['el'] = np.where(el_offset >= 0.0, el_offset, 180.0 + el_offset)
+    pattern['az'] = values[:, 1]
+    pattern['gain'] = values[:, 2]
+    return pattern
+
+def parse_pattern(output: str, return_format: str = 'dicts') -> Any:
     # Parse the TOTAL PATTERN (DB) column directly from pymininec output.
-    pattern: List[Dict[str, float]] = []
-    in_table = False
-    header_lines_to_skip = 0
-    for line in output.splitlines():
-        if not in_table:
-            if 'PATTERN DATA' in line:
-                in_table = True
-                # Skip the next two header lines (column titles)
-                header_lines_to_skip = 2
-            continue
-        if header_lines_to_skip > 0:
-            header_lines_to_skip -= 1
+    # return_format='structured' yields a PATTERN_DTYPE array, 'soa' a dict of column arrays.
+    pos = output.find(_PATTERN_HEADER)
+    # Table rows follow the banner and two column-title lines; walk past those three
+    # newlines so the block is sliced out of the transcript with a single copy
+    for _ in range(3):
+        if pos < 0:
+            break
+        pos = output.find('\n', pos)
+        pos = pos + 1 if pos >= 0 else -1
+    block = output[pos:] if pos >= 0 else ''
+    return _pattern_as(_parse_pattern_block(block), return_format)
+
+class _StreamParser:
+    """
+    Internal: single pass over pymininec output lines as they arrive. Matches the impedance
+    until found, then buffers only the pattern table rows. Gives the same values as
+    parse_impedance/parse_pattern(return_format='structured') on the joined text.
+    """
+    # Table rows are parsed in blocks of this many lines while the solver is still printing
+    CHUNK_ROWS = 4096
+
+    def __init__(self, need_impedance: bool = True, need_pattern: bool = True, keep_raw: bool = False):
+        self.need_impedance = need_impedance
+        self.need_pattern = need_pattern
+        self.keep_raw = keep_raw
+        self.impedance: Optional[Tuple[float, float]] = None
+        self.table: Optional[List[str]] = None
+        self.parsed: List[np.ndarray] = []
+        self.skip = 0
+        self.raw: List[str] = []
+
+    def feed(self, line: str) -> None:
+        if self.keep_raw:
+            self.raw.append(line)
+        if self.table is not None:
+            if self.skip:
+                self.skip -= 1
+            elif self.need_pattern:
+                self.table.append(line)
+                if len(self.table) >= self.CHUNK_ROWS:
+                    self.parsed.append(_parse_pattern_block(''.join(self.table)))
+                    self.table = []
+        elif _PATTERN_HEADER in line:
+            # Banner plus two column-title lines precede the rows
+            self.table, self.skip = [], 2
+        elif self.need_impedance and self.impedance is None and _IMPEDANCE_TAG in line:
+            self.impedance = parse_impedance(line)
+
+    def feed_rows(self, rows: List[str]) -> None:
+        # A block of table rows, once the table has started
+        self.parsed.append(_parse_pattern_block(''.join(rows)))
+
+    def result(self) -> Dict[str, Any]:
+        pattern = None
+        if self.need_pattern:
+            pattern = _parse_pattern_block(''.join(self.table or []))
+            if self.parsed:
+                pattern = np.concatenate(self.parsed + [pattern])
+        return {
+            'impedance': self.impedance,
+            'pattern': pattern,
+            'raw_output': ''.join(self.raw) if self.keep_raw else None,
+        }
+
+def _parse_pymininec_stream(lines: Iterable[str], **flags: bool) -> Dict[str, Any]:
+    parser = _StreamParser(**flags)
+    it = iter(lines)
+    for line in it:
+        parser.feed(line)
+        if parser.keep_raw:
             continue
-        parts = line.strip().split()
-        # Expect at least: zenith, azimuth, vertical_db, horizontal_db, total_db
-        if len(parts) >= 5:
-            try:
-                zenith = float(parts[0])
-                az = float(parts[1])
-                total_db = float(parts[4])
-                # Convert zenith angle (0=up) to elevation (0–180 horizon-to-horizon)
-                el_offset = 90.0 - zenith
-                elevation = el_offset if el_offset >= 0.0 else 180.0 + el_offset
-                pattern.append({'el': elevation, 'az': az, 'gain': total_db})
-            except ValueError:
-                continue
+        if parser.table is not None and not parser.skip and parser.need_pattern:
+            # Only table rows remain: take them in blocks rather than one feed() per line
+            for rows in iter(lambda: list(islice(it, parser.CHUNK_ROWS)), []):
+                parser.feed_rows(rows)
+            break
+        if not parser.need_pattern and (parser.impedance is not None or not parser.need_impedance):
+            break
+    # Drain anything left unread, so a writer on the other end of a pipe never blocks
+    deque(it, maxlen=0)
+    return parser.result()
+
+def _run_pymininec_inproc(
+    argv: List[str],
+    option: str,
+    pattern_opts: Optional[Dict[str, str]],
+    ff_distance: int,
+    need_impedance: bool = True,
+    need_pattern: bool = True,
+    keep_raw: bool = False,
+) -> Dict[str, Any]:
+    """
+    Internal: Run pymininec in this process and return {'impedance', 'pattern', 'raw_output'}
+    with the same values a CLI run parses to. Model setup reuses the CLI's own argument
+    handling (main(return_mininec=True)); the single-frequency solve and far-field steps
+    mirror the rest of its main().
+    Only keep_raw renders the report text; otherwise impedance and a 'far-field' pattern are
+    read from the solver's own objects, and the far field is skipped if no pattern is wanted.
+    """
+    err = io.StringIO()
+    try:
+        m = _mininec.main(argv, f_err=err, return_mininec=True)
+    except SystemExit as exc:  # argparse error
+        raise RuntimeError(f"pymininec rejected arguments (exit {exc.code})") from None
+    if not isinstance(m, _mininec.Mininec):
+        raise RuntimeError(f"pymininec rejected arguments: {err.getvalue().strip()}")
+    pattern_opts = pattern_opts or {}
+    # Same defaults as the pymininec CLI
+    zenith = _mininec.Angle(*_parse_angle(pattern_opts.get('theta', '0,10,10')))
+    azimuth = _mininec.Angle(*_parse_angle(pattern_opts.get('phi', '0,10,37')))
+    m.f = float(argv[1])
+    m.compute()
+    if (need_pattern or keep_raw) and option.startswith('far'):
+        if option == 'far-field-absolute':
+            m.compute_far_field(zenith, azimuth, dist=ff_distance)
+        else:
+            m.compute_far_field(zenith, azimuth)
+    if keep_raw or (need_pattern and option != 'far-field'):
+        output = m.as_mininec({option}) + "\n"
+        return {
+            'impedance': parse_impedance(output) if need_impedance else None,
+            'pattern': parse_pattern(output, return_format='structured') if need_pattern else None,
+            'raw_output': output,
+        }
+    return {
+        'impedance': _source_impedance(m) if need_impedance else None,
+        'pattern': _far_field_records(m.far_field) if need_pattern else None,
+        'raw_output': None,
+    }
+
+
+def _printed(values: Sequence[float], use_e: bool = False) -> np.ndarray:
+    # Values as pymininec prints them: its own format_float, read back as floats
+    return np.array([float(s) for s in _mininec.format_float(values, use_e=use_e)], dtype=np.float64)
+
+
+def _source_impedance(m: Any) -> Optional[Tuple[float, float]]:
+    # The first source's impedance as printed in SOURCE DATA (what parse_impedance finds)
+    if not m.sources:
+        return None
+    z = m.sources[0].impedance
+    R, X = _printed([z.real, z.imag], use_e=True).tolist()
+    return (R, X)
+
+
+def _far_field_records(far_field: Any) -> np.ndarray:
+    # The pattern table as a PATTERN_DTYPE array, straight from pymininec's far-field arrays.
+    # Values go through pymininec's own format_float, so they match the printed table (and
+    # parse_pattern) exactly; printing and re-parsing every row is the slow part of a run.
+    # Angles repeat along the grid, so each distinct angle is formatted once.
+    zenith, zen_idx = np.unique(np.asarray(far_field.zen, dtype=np.float64).ravel(), return_inverse=True)
+    azimuth, azi_idx = np.unique(np.asarray(far_field.azi, dtype=np.float64).ravel(), return_inverse=True)
+    # db_as_mininec prints the total gain column of gain.T, flattened
+    total = far_field.gain.T[2].ravel()
+    pattern = np.empty(len(total), dtype=PATTERN_DTYPE)
+    el_offset = 90.0 - _printed(zenith.tolist())[zen_idx]
+    pattern['el'] = np.where(el_offset >= 0.0, el_offset, 180.0 + el_offset)
+    pattern['az'] = _printed(azimuth.tolist())[azi_idx]
+    pattern['gain'] = _printed(total.tolist())
     return pattern
 
-def _run_pymininec(
+
+def _parse_angle(spec: str) -> Tuple[float, float, int]:
+    start, inc, count = spec.split(',')
+    return float(start), float(inc), int(count)
+
+
+# Parsed pymininec results keyed by a hash of the full command line (which pins down model,
+# frequency, height, ground and pattern options); identical runs are common across the
+# compute_* helpers, sweeps and the example scripts. Least-recently-used entries are evicted
+# beyond _PYMININEC_CACHE_SIZE so long sweeps do not grow without bound.
+_PYMININEC_CACHE_SIZE = 512
+# Per-simulator limit on memoised compute_* patterns (see _cached_pattern)
+_PATTERN_CACHE_SIZE = 256
+_PYMININEC_CACHE: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+# Opt-in persistent copy of the cache (e.g. ANTENNA_CACHE_DIR=~/.cache/antenna-model), so
+# reruns of a script skip solves done by earlier processes. One pickle per entry; raw
+# transcripts are not written.
+_DISK_CACHE_ENV = 'ANTENNA_CACHE_DIR'
+# Bump when the layout of a cached entry changes
+_DISK_CACHE_FORMAT = 1
+
+@lru_cache(maxsize=1)
+def _pymininec_version() -> str:
+    from importlib.metadata import PackageNotFoundError, version
+    try:
+        return version('pymininec')
+    except PackageNotFoundError:
+        return 'unknown'
+
+def _disk_cache_path(key: str) -> Optional[str]:
+    # Entries live in a subdirectory per cache format, pymininec version and solve path
+    # (in-process or CLI), so none of them is ever served to a different one
+    cache_dir = os.environ.get(_DISK_CACHE_ENV)
+    if not cache_dir:
+        return None
+    engine = 'inproc' if _mininec is not None else 'cli'
+    subdir = f"v{_DISK_CACHE_FORMAT}-pymininec-{_pymininec_version()}-{engine}"
+    return os.path.join(os.path.expanduser(cache_dir), subdir, f"{key}.pkl")
+
+def _cache_get(key: str) -> Optional[Dict[str, Any]]:
+    result = _PYMININEC_CACHE.get(key)
+    if result is not None:
+        _PYMININEC_CACHE.move_to_end(key)
+        return result
+    path = _disk_cache_path(key)
+    if path is None or not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'rb') as f:
+            result = pickle.load(f)
+    except Exception:
+        # Unreadable, truncated or stale entries (e.g. pickled against other code) are misses
+        return None
+    if not isinstance(result, dict):
+        return None
+    _cache_put(key, result, persist=False)
+    return result
+
+def _cache_put(key: str, result: Dict[str, Any], persist: bool = True) -> None:
+    _PYMININEC_CACHE[key] = result
+    _PYMININEC_CACHE.move_to_end(key)
+    while len(_PYMININEC_CACHE) > _PYMININEC_CACHE_SIZE:
+        _PYMININEC_CACHE.popitem(last=False)
+    path = _disk_cache_path(key) if persist else None
+    if path is not None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write then rename, so concurrent workers never see a partial file
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump({k: v for k, v in result.items() if k != 'raw_output'}, f)
+            os.replace(tmp, path)
+        finally:
+            # Only left behind if the dump or rename failed
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+
+def _pymininec_cmd(
     model: AntennaModel,
     freq_mhz: float,
     height_m: float = 0.0,
-    ground_opts: Optional[List[str]] = None,
+    ground_opts: Optional[Sequence[str]] = None,
     excitation_pulse: str = "10,1",
     pattern_opts: Optional[Dict[str, str]] = None,
     option: str = "far-field-absolute",
     ff_distance: int = 1000,
-) -> Dict[str, Any]:
+) -> List[str]:
     """
-    Internal: Run pymininec with the given model, frequency, height, and options.
+    Internal: Build the pymininec command line for the given model, frequency, height, and options.
     """
+    if not ground_opts:
+        # Free space has no image: a height offset only translates the structure, so every
+        # height is solved (and cached) once as height 0.
+        height_m = 0.0
     cmd = ["pymininec", "-f", str(freq_mhz)]
     cmd += model.to_pymininec_args(height_m=height_m)
     if ground_opts:
         cmd += ground_opts
-    # Handle feedpoints (excitation sources)
-    # If explicit feedpoints are present on the model, generate a matching pair of
-    #   --excitation-pulse=<pulse,tag>  and  --excitation-voltage=<real,imag>
-    #   for each feedpoint.  Otherwise, fall back to the legacy single
-    #   --excitation-pulse parameter.
+    # Handle feedpoints (excitation sources); without any, fall back to the legacy
+    # single --excitation-pulse parameter.
     if model.feedpoints:
-        for fp in model.feedpoints:
-            # Auto-assigned wire tags start at 1 in the order the elements were
-            # added, so tag = element_index + 1
-            tag = fp["element_index"] + 1
-            segment = fp["segment"]
-            # A wire with N segments contains N-1 pulses.  A pulse number of P
-            # refers to the junction between segment P and P+1, so feeding *in*
-            # segment *segment* means using pulse = segment-1.  This matches the
-            # convention used by the original MININEC CLI and the earlier hard-
-            # coded default ("10,1") that fed the centre segment of a 21-segment
-            # dipole.
-            pulse = max(segment - 1, 1)
-            v: complex = fp.get("voltage", 1 + 0j)
-            # Format complex voltage as "a+bj" or "a-bj" (omit imag part if zero)
-            if abs(v.imag) < 1e-12:
-                v_str = f"{v.real:g}"
-            else:
-                # Sign handled automatically by formatting imag with sign
-                imag_part = f"{v.imag:g}j"
-                # Ensure plus sign if imag positive
-                sign = '+' if v.imag >= 0 else ''
-                v_str = f"{v.real:g}{sign}{imag_part}"
-            cmd += ["--excitation-pulse", f"{pulse},{tag}"]
-            cmd += ["--excitation-voltage", v_str]
+        cmd += model._feed_args()
     else:
         # Backwards compatibility: default single feed at "excitation_pulse"
         cmd += ["--excitation-pulse", excitation_pulse]
@@ -215,14 +614,204 @@ def _run_pymininec(
     if pattern_opts:
         for k, v in pattern_opts.items():
             cmd += [f"--{k}", v]
-    proc = subprocess.run(cmd, capture_output=True, text=True, check=True)
-    output = proc.stdout
+    return cmd
+
+
+# pymininec prints plain ASCII; a single-byte codec decodes it without UTF-8 (or locale)
+# validation and can never fail on a stray byte
+_PYMININEC_ENCODING = 'latin-1'
+
+
+def _pymininec_cache_key(cmd: List[str]) -> str:
+    # "<solve>-<output>": the first part hashes everything before --option (model, frequency,
+    # height, ground, feeds), which alone determines the impedance; the second hashes the
+    # far-field options. Runs that differ only in pattern grid share the solve part.
+    split = cmd.index('--option') if '--option' in cmd else len(cmd)
+    solve = hashlib.blake2b("\0".join(cmd[:split]).encode(), digest_size=16).hexdigest()
+    output = hashlib.blake2b("\0".join(cmd[split:]).encode(), digest_size=16).hexdigest()
+    return f"{solve}-{output}"
+
+
+def _solve_cache_key(key: str) -> str:
+    return key.split('-', 1)[0]
+
+
+_RUN_FLAGS = ('need_impedance', 'need_pattern', 'keep_raw')
+
+
+def _split_run_flags(run: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, bool]]:
+    # Separate the parse/retain flags from the keywords that shape the pymininec command
+    flags = {k: run[k] for k in _RUN_FLAGS if k in run}
+    return {k: v for k, v in run.items() if k not in _RUN_FLAGS}, flags
+
+
+def _union_run_flags(a: Dict[str, bool], b: Dict[str, bool]) -> Dict[str, bool]:
+    # Parse flags covering both requests for one solve (need_* default on, keep_raw off)
+    return {k: a.get(k, k != 'keep_raw') or b.get(k, k != 'keep_raw') for k in _RUN_FLAGS}
+
+
+def _cached_run(key: str, need_impedance: bool = True, need_pattern: bool = True,
+                keep_raw: bool = False) -> Optional[Dict[str, Any]]:
+    # A cache entry only holds the parts that were asked for when it was stored
+    cached = _cache_get(key)
+    if need_impedance and not need_pattern and not keep_raw and 'impedance' not in (cached or {}):
+        # The impedance of any run of the same solve will do, whatever its pattern grid
+        cached = _cache_get(_solve_cache_key(key))
+    if cached is None:
+        return None
+    if ((need_impedance and 'impedance' not in cached) or (need_pattern and 'pattern' not in cached)
+            or (keep_raw and 'raw_output' not in cached)):
+        return None
+    return cached
+
+
+def _run_result(entry: Dict[str, Any]) -> Dict[str, Any]:
     return {
-        'impedance': parse_impedance(output),
-        'pattern': parse_pattern(output),
-        'raw_output': output
+        'impedance': entry.get('impedance'),
+        'pattern': entry.get('pattern'),
+        'raw_output': entry.get('raw_output'),
     }
 
+
+def _merge_run_result(key: str, result: Dict[str, Any], need_impedance: bool = True,
+                      need_pattern: bool = True, keep_raw: bool = False) -> Dict[str, Any]:
+    # Add the requested parts of a run result to its cache entry
+    entry = dict(_cache_get(key) or {})
+    for part, wanted in (('impedance', need_impedance), ('pattern', need_pattern), ('raw_output', keep_raw)):
+        if wanted:
+            entry[part] = result[part]
+    _cache_put(key, entry)
+    if need_impedance and result['impedance'] is not None:
+        _cache_put(_solve_cache_key(key), {'impedance': result['impedance']})
+    return _run_result(entry)
+
+
+def _run_pymininec(
+    model: AntennaModel,
+    freq_mhz: float,
+    height_m: float = 0.0,
+    ground_opts: Optional[Sequence[str]] = None,
+    excitation_pulse: str = "10,1",
+    pattern_opts: Optional[Dict[str, str]] = None,
+    option: str = "far-field-absolute",
+    ff_distance: int = 1000,
+    need_impedance: bool = True,
+    need_pattern: bool = True,
+    keep_raw: bool = False,
+) -> Dict[str, Any]:
+    """
+    Internal: Run pymininec with the given model, frequency, height, and options.
+    Only the parts flagged by need_impedance/need_pattern are parsed; the raw stdout is
+    returned as 'raw_output' only with keep_raw=True (otherwise None).
+    """
+    cmd = _pymininec_cmd(model, freq_mhz, height_m, ground_opts, excitation_pulse,
+                         pattern_opts, option, ff_distance)
+    key = _pymininec_cache_key(cmd)
+    flags = dict(need_impedance=need_impedance, need_pattern=need_pattern, keep_raw=keep_raw)
+    cached = _cached_run(key, **flags)
+    if cached is not None:
+        return _run_result(cached)
+    if _mininec is not None:
+        result = _run_pymininec_inproc(cmd[1:], option, pattern_opts, ff_distance, **flags)
+        return _merge_run_result(key, result, **flags)
+    # Parse the CLI's stdout as it streams rather than buffering the whole transcript. stderr
+    # goes to a temporary file, so a chatty solver can't block on a full pipe meanwhile.
+    with tempfile.TemporaryFile() as err, \
+            subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=err,
+                             encoding=_PYMININEC_ENCODING, bufsize=1 << 20) as proc:
+        result = _parse_pymininec_stream(proc.stdout, **flags)
+        proc.wait()
+        err.seek(0)
+        stderr = err.read().decode(_PYMININEC_ENCODING)
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, result['raw_output'], stderr)
+    return _merge_run_result(key, result, **flags)
+
+
+async def _run_pymininec_async(semaphore: asyncio.Semaphore, **run: Any) -> Dict[str, Any]:
+    """
+    Internal: _run_pymininec as a coroutine. CLI runs use asyncio subprocesses so many can
+    be in flight at once; in-process solves run on a worker thread. Shares the run cache.
+    """
+    run, flags = _split_run_flags(run)
+    cmd = _pymininec_cmd(**run)
+    key = _pymininec_cache_key(cmd)
+    cached = _cached_run(key, **flags)
+    if cached is not None:
+        return _run_result(cached)
+    option = run.get('option', 'far-field-absolute')
+    async with semaphore:
+        if _mininec is not None:
+            result = await asyncio.to_thread(
+                _run_pymininec_inproc, cmd[1:], option, run.get('pattern_opts'), run.get('ff_distance', 1000),
+                **flags
+            )
+        else:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, limit=1 << 20
+            )
+            # Parse stdout line by line as it arrives (draining stderr alongside so neither
+            # pipe can fill up), instead of buffering and decoding the whole transcript
+            parser = _StreamParser(**flags)
+
+            async def read_stdout() -> None:
+                async for line in proc.stdout:
+                    parser.feed(line.decode(_PYMININEC_ENCODING))
+
+            _, stderr = await asyncio.gather(read_stdout(), proc.stderr.read())
+            await proc.wait()
+            result = parser.result()
+            if proc.returncode:
+                raise subprocess.CalledProcessError(proc.returncode, cmd, result['raw_output'],
+                                                    stderr.decode(_PYMININEC_ENCODING))
+    return _merge_run_result(key, result, **flags)
+
+
+def _max_workers(max_workers: Optional[int] = None) -> int:
+    # Explicit argument first, then the ANTENNA_MAX_WORKERS environment variable, then one
+    # per CPU
+    if max_workers:
+        return max_workers
+    env = os.environ.get('ANTENNA_MAX_WORKERS')
+    if not env:
+        return os.cpu_count() or 1
+    try:
+        return max(1, int(env))
+    except ValueError:
+        raise ValueError(f"ANTENNA_MAX_WORKERS must be an integer, got {env!r}") from None
+
+
+def _prefetch_pymininec(runs: List[Dict[str, Any]], max_workers: Optional[int] = None) -> None:
+    """
+    Internal: Fill the run cache for many _run_pymininec keyword sets at once, launching up to
+    max_workers (default ANTENNA_MAX_WORKERS, else os.cpu_count()) runs concurrently. Inside
+    an already-running event loop (e.g. a notebook) this is skipped and the runs happen on
+    demand instead.
+    """
+    pending: Dict[str, Dict[str, Any]] = {}
+    for run in runs:
+        cmd_run, flags = _split_run_flags(run)
+        key = _pymininec_cache_key(_pymininec_cmd(**cmd_run))
+        if _cached_run(key, **flags) is not None:
+            continue
+        if key in pending:
+            # Same solve requested with different parse flags: parse the union
+            flags = _union_run_flags(_split_run_flags(pending[key])[1], flags)
+        pending[key] = {**cmd_run, **flags}
+    if len(pending) <= 1:
+        return
+    try:
+        asyncio.get_running_loop()
+        return
+    except RuntimeError:
+        pass
+
+    async def run_all() -> None:
+        semaphore = asyncio.Semaphore(_max_workers(max_workers))
+        await asyncio.gather(*(_run_pymininec_async(semaphore, **run) for run in pending.values()))
+
+    asyncio.run(run_all())
+
 class AntennaSimulator:
     """
     Abstracts antenna simulation engine (currently only pymininec).
@@ -234,121 +823,353 @@ class AntennaSimulator:
         if engine != "pymininec":
             raise NotImplementedError("Only pymininec engine is supported currently.")
         self.engine = engine
+        # Worker pool for simulate_many, started on first use and kept warm across calls
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_workers = 0
+        # Bounded LRU of compute_elevation_patterns / compute_azimuth_patterns results
+        self._pattern_cache: "OrderedDict[Tuple, Any]" = OrderedDict()
 
-    def _round_step(self, step: float, total: float = 180.0) -> float:
-        # Find the nearest step that divides total evenly
-        n_steps = round(total / step)
-        if n_steps < 1:
-            n_steps = 1
-        return total / n_steps
+    def __getstate__(self) -> Dict[str, Any]:
+        # A live pool can't cross a process boundary; the copy starts its own if needed,
+        # and starts with an empty pattern cache rather than shipping this one
+        return {**self.__dict__, '_pool': None, '_pool_workers': 0, '_pattern_cache': OrderedDict()}
 
-    def simulate_pattern(
+    def close(self) -> None:
+        """Shut down the simulate_many worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+            self._pool_workers = 0
+
+    def __enter__(self) -> 'AntennaSimulator':
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    @staticmethod
+    def _step_count(step: float, total: float = 180.0) -> int:
+        # Number of intervals of the nearest step that divides total evenly; the rounded step
+        # is total / n, and point counts derive from n without a second float division
+        return max(1, round(total / step))
+
+    def simulate_many(self, tasks: List[Dict[str, Any]],
+                      max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Run many independent pymininec solves across CPU cores, for parameter sweeps.
+        Each task is a dict of _run_pymininec keywords (model, freq_mhz, height_m, ground_opts,
+        pattern_opts, option, ...). Returns {'impedance', 'pattern', 'raw_output'} per task, in
+        order, with 'pattern' as a PATTERN_DTYPE array; 'raw_output' is None unless the task
+        sets keep_raw=True. Results are added to the run cache. The worker pool has
+        max_workers processes (default: ANTENNA_MAX_WORKERS, else one per CPU) and stays up
+        for later calls; release it with close() or by using the simulator as a context manager.
+        """
+        split = [_split_run_flags(task) for task in tasks]
+        keys = [_pymininec_cache_key(_pymininec_cmd(**run)) for run, _ in split]
+        pending: Dict[str, Dict[str, Any]] = {}
+        for key, (run, flags) in zip(keys, split):
+            if _cached_run(key, **flags) is not None:
+                continue
+            if key in pending:
+                # Same solve requested with different parse flags: parse the union
+                flags = _union_run_flags(_split_run_flags(pending[key])[1], flags)
+            pending[key] = {**run, **flags}
+        done: Dict[str, Dict[str, Any]] = {}
+        if len(pending) > 1:
+            workers = _max_workers(max_workers)
+            if self._pool is not None and self._pool_workers != workers:
+                # Asked for a different size than the warm pool has: replace it
+                self.close()
+            if self._pool is None:
+                # Reused by later calls, so worker start-up and imports are paid once
+                self._pool = ProcessPoolExecutor(max_workers=workers)
+                self._pool_workers = workers
+            futures = {key: self._pool.submit(_run_pymininec, **task) for key, task in pending.items()}
+            for key, fut in futures.items():
+                done[key] = fut.result()
+                _merge_run_result(key, done[key], **_split_run_flags(pending[key])[1])
+        results = []
+        for key, task, (_, flags) in zip(keys, tasks, split):
+            cached = _cached_run(key, **flags)
+            if cached is not None:
+                results.append(_run_result(cached))
+            elif key in done:
+                # Held locally too, so sweeps larger than the cache are not re-run on the way out
+                results.append(done[key])
+            else:
+                results.append(_run_pymininec(**task))
+        return results
+
+    def _prefetch(self, runs: List[Dict[str, Any]], max_workers: Optional[int] = None) -> None:
+        # Fill the run cache for independent runs (one per height or frequency) concurrently.
+        # In-process solves hold the GIL, so they go to the worker pool rather than threads;
+        # CLI runs are subprocesses already and are overlapped by _prefetch_pymininec.
+        if _mininec is not None and _max_workers(max_workers) > 1:
+            self.simulate_many(runs, max_workers)
+        else:
+            _prefetch_pymininec(runs, max_workers)
+
+    def _impedance_run(
         self,
         model: AntennaModel,
         freq_mhz: float,
         height_m: float,
-        ground: str = "average",
-        el_step: float = 5.0,
-        az_step: float = 5.0,
-        ff_distance: int = 1000,
+        ground: str,
     ) -> Dict[str, Any]:
+        # _run_pymininec keyword set behind simulate_impedance: option "none" leaves out the
+        # far field (and its --theta/--phi grid) altogether
+        return dict(
+            model=model,
+            freq_mhz=freq_mhz,
+            height_m=height_m,
+            ground_opts=get_ground_opts(ground),
+            option="none",
+            need_pattern=False,
+        )
+
+    def simulate_impedance(
+        self,
+        model: AntennaModel,
+        freq_mhz: float,
+        height_m: float,
+        ground: str = "average",
+    ) -> Tuple[float, float]:
         """
-        Simulate the antenna pattern and impedance.
-        Returns dict with 'impedance' and 'pattern' (list of dicts with el, az, gain).
-        Always returns a full 0-180 deg elevation and 0-360 deg azimuth grid.
-        If elevation >90° is requested, combines az=0 and az=180° as needed.
-        Step sizes are rounded to values that divide 180 (el) and 360 (az) evenly.
+        Return the feedpoint impedance (R, X) without computing any far-field pattern.
         """
+        return _run_pymininec(**self._impedance_run(model, freq_mhz, height_m, ground))['impedance']
+
+    def _pattern_run(
+        self,
+        model: AntennaModel,
+        freq_mhz: float,
+        height_m: float,
+        ground: str,
+        el_step: float,
+        az_step: float,
+        ff_distance: int = 1000,
+        el_max: float = 180.0,
+    ) -> Dict[str, Any]:
+        # _run_pymininec keyword set behind simulate_pattern. The az=0 and az=180 half-cuts
+        # share one solve (phi "0,180,2"); a model symmetric about the yz plane, or
+        # el_max <= 90, needs only az=0.
         ground_opts = get_ground_opts(ground)
-        # Round step sizes
-        el_step = self._round_step(el_step, 180.0)
-        az_step = self._round_step(az_step, 360.0)
+        # Round the elevation step to divide 180° evenly
+        n_el = self._step_count(el_step, 180.0)
         # Only simulate zenith 0–90° (elevation 90–0°) at az=0 and az=180
         theta_start = 0
-        theta_step = el_step
-        theta_count = int(90 / el_step) + 1
-        phi_list = [0, 180]
-        # Simulate at az=0
-        pattern_opts_0 = {
-            "theta": f"{theta_start},{theta_step},{theta_count}",
-            "phi": "0,0,1"
-        }
-        result_0 = _run_pymininec(
-            model,
-            freq_mhz=freq_mhz,
-            height_m=height_m,
-            ground_opts=ground_opts,
-            pattern_opts=pattern_opts_0,
-            option="far-field",
-            ff_distance=ff_distance
-        )
-        # Simulate at az=180
-        pattern_opts_180 = {
-            "theta": f"{theta_start},{theta_step},{theta_count}",
-            "phi": "180,0,1"
-        }
-        result_180 = _run_pymininec(
-            model,
+        theta_step = 180.0 / n_el
+        theta_count = n_el // 2 + 1
+        both = el_max > 90.0 and not model.is_symmetric_about_yz()
+        return dict(
+            model=model,
             freq_mhz=freq_mhz,
             height_m=height_m,
             ground_opts=ground_opts,
-            pattern_opts=pattern_opts_180,
+            pattern_opts={
+                "theta": f"{theta_start},{theta_step},{theta_count}",
+                "phi": "0,180,2" if both else "0,0,1",
+            },
             option="far-field",
-            ff_distance=ff_distance
+            ff_distance=ff_distance,
         )
-        # Build full 0–180° elevation cut at az=0
-        pattern = []
-        # Elevation 0–90° from az=0
-        for p in result_0['pattern']:
-            el = p['el']
-            if 0 <= el <= 90:
-                pattern.append({'el': el, 'az': 0.0, 'gain': p['gain']})
-        # Elevation 90–180° from az=180 (map el to 180-el)
-        for p in result_180['pattern']:
-            el = p['el']
-            if 0 <= el <= 90:
-                pattern.append({'el': 180.0 - el, 'az': 0.0, 'gain': p['gain']})
-        # Sort by elevation
-        pattern = sorted(pattern, key=lambda x: x['el'])
-        # Use impedance from az=0 run
+
+    def simulate_pattern(
+        self,
+        model: AntennaModel,
+        freq_mhz: float,
+        height_m: float,
+        ground: str = "average",
+        el_step: float = 5.0,
+        az_step: float = 5.0,
+        ff_distance: int = 1000,
+        return_format: str = 'dicts',
+        el_max: float = 180.0,
+    ) -> Dict[str, Any]:
+        """
+        Simulate the antenna pattern and impedance.
+        Returns dict with 'impedance' and 'pattern' (list of dicts with el, az, gain;
+        a PATTERN_DTYPE array if return_format='structured'; a dict of 'el'/'az'/'gain'
+        arrays if return_format='soa').
+        Returns the elevation cut from 0 up to el_max deg (default: the full 0-180 deg).
+        If elevation >90° is requested, combines az=0 and az=180° as needed (both come
+        from a single pymininec run); with el_max <= 90 only az=0 is computed.
+        Step sizes are rounded to values that divide 180 (el) and 360 (az) evenly.
+        """
+        run = self._pattern_run(model, freq_mhz, height_m, ground, el_step, az_step, ff_distance, el_max)
+        result = _run_pymininec(**run)
+        # Build full 0–180° elevation cut at az=0:
+        # elevation 0–90° from az=0, 90–180° from az=180 (map el to 180-el)
+        rows = result['pattern']
+        if run['pattern_opts']['phi'] == "0,180,2":
+            # Phi steps slowest, so the az=0 half-cut is the first half of the table
+            half = len(rows) // 2
+            if 2 * half != len(rows):
+                raise RuntimeError(f"pymininec returned {len(rows)} pattern rows for two half-cuts")
+            front, back = rows[:half], rows[half:]
+        else:
+            front = rows
+            # Symmetric models mirror the az=0 half-cut onto az=180
+            back = front[:0] if el_max <= 90.0 else front
+        front_el, back_el = front['el'], back['el']
+        front_mask = (front_el >= 0) & (front_el <= min(el_max, 90.0))
+        back_mask = (back_el >= 180.0 - el_max) & (back_el <= 90)
+        # Fill one output buffer column by column rather than concatenating masked copies.
+        # Zenith runs ascending, so the front cut arrives in descending elevation.
+        n_front = np.count_nonzero(front_mask)
+        pattern = np.empty(n_front + np.count_nonzero(back_mask), dtype=PATTERN_DTYPE)
+        pattern['el'][:n_front] = front_el[front_mask][::-1]
+        pattern['el'][n_front:] = 180.0 - back_el[back_mask]
+        pattern['gain'][:n_front] = front['gain'][front_mask][::-1]
+        pattern['gain'][n_front:] = back['gain'][back_mask]
+        pattern['az'] = 0.0
+        if np.any(pattern['el'][1:] < pattern['el'][:-1]):
+            # Sort by elevation (stable, so ties keep run order)
+            pattern = pattern[np.argsort(pattern['el'], kind='stable')]
         return {
-            'impedance': result_0['impedance'],
-            'pattern': pattern
+            'impedance': result['impedance'],
+            'pattern': _pattern_as(pattern, return_format)
         }
 
-    def simulate_azimuth_pattern(
+    def simulate_sweep(
         self,
         model: AntennaModel,
-        freq_mhz: float,
+        freqs_mhz: List[float],
         height_m: float,
-        ground: str,
-        el: float,
+        ground: str = "average",
+        el_step: float = 5.0,
         az_step: float = 5.0,
-    ) -> List[Dict[str, float]]:
+        coarse_n: int = 8,
+        ff_distance: int = 1000,
+        return_format: str = 'dicts',
+    ) -> List[Dict[str, Any]]:
         """
-        Simulate azimuth cut at a fixed elevation (deg) by sweeping phi.
-        Returns list of dicts with 'el', 'az', 'gain'.
+        Fast frequency sweep: solve simulate_pattern at coarse_n log-spaced frequencies across
+        the span of freqs_mhz, then cubic-spline R, X and every pattern gain to each requested
+        frequency. Returns one {'freq_mhz', 'impedance', 'pattern'} per frequency, in order.
+        Exact at the coarse points; with coarse_n or fewer frequencies every point is solved.
+        Spline values near deep pattern nulls are approximate. Requires scipy.
         """
+        freqs = np.asarray(freqs_mhz, dtype=np.float64)
+        if len(freqs) <= coarse_n or freqs.min() == freqs.max():
+            coarse = np.unique(freqs)
+        else:
+            coarse = np.geomspace(freqs.min(), freqs.max(), max(coarse_n, 2))
+        # Every coarse point is independent; start all of their runs together
+        self._prefetch([self._pattern_run(model, f, height_m, ground, el_step, az_step, ff_distance)
+                        for f in coarse])
+        solved = [self.simulate_pattern(model, f, height_m, ground, el_step, az_step, ff_distance,
+                                        return_format='structured') for f in coarse]
+        template = solved[0]['pattern']
+        gains = np.stack([r['pattern']['gain'] for r in solved])
+        impedances = np.array([r['impedance'] for r in solved], dtype=np.float64)
+        if len(coarse) > 1:
+            from scipy.interpolate import CubicSpline
+            gains = CubicSpline(coarse, gains, axis=0)(freqs)
+            impedances = CubicSpline(coarse, impedances, axis=0)(freqs)
+        else:
+            gains = np.repeat(gains, len(freqs), axis=0)
+            impedances = np.repeat(impedances, len(freqs), axis=0)
+        results = []
+        for f, gain, (R, X) in zip(freqs.tolist(), gains, impedances.tolist()):
+            pattern = template.copy()
+            pattern['gain'] = gain
+            results.append({'freq_mhz': f, 'impedance': (R, X), 'pattern': _pattern_as(pattern, return_format)})
+        return results
+
+    def _azimuth_run(
+        self,
+        model: AntennaModel,
+        freq_mhz: float,
+        height_m: float,
+        ground: str,
+        el: float,
+        az_step: float,
+    ) -> Dict[str, Any]:
+        # _run_pymininec keyword set behind simulate_azimuth_pattern
         ground_opts = get_ground_opts(ground)
         # Convert elevation to zenith angle
         zenith = 90.0 - el
         # Round phi step
-        phi_step = self._round_step(az_step, 360.0)
-        phi_count = int(360.0 / phi_step) + 1
+        n_phi = self._step_count(az_step, 360.0)
+        phi_step = 360.0 / n_phi
+        phi_count = n_phi + 1
         pattern_opts = {
             'theta': f'{zenith:.6f},0,1',
             'phi': f'0,{phi_step},{phi_count}'
         }
-        result = _run_pymininec(
-            model,
+        return dict(
+            model=model,
             freq_mhz=freq_mhz,
             height_m=height_m,
             ground_opts=ground_opts,
             pattern_opts=pattern_opts,
-            option='far-field'
+            option='far-field',
+            need_impedance=False,
         )
+
+    def simulate_azimuth_pattern(
+        self,
+        model: AntennaModel,
+        freq_mhz: float,
+        height_m: float,
+        ground: str,
+        el: float,
+        az_step: float = 5.0,
+        return_format: str = 'dicts',
+    ) -> Any:
+        """
+        Simulate azimuth cut at a fixed elevation (deg) by sweeping phi.
+        Returns list of dicts with 'el', 'az', 'gain' (or a PATTERN_DTYPE array
+        if return_format='structured', or a dict of arrays if return_format='soa').
+        """
+        result = _run_pymininec(**self._azimuth_run(model, freq_mhz, height_m, ground, el, az_step))
         # Return only entries at the requested elevation
-        return [p for p in result['pattern'] if abs(p['el'] - el) < 1e-3]
+        pattern = result['pattern']
+        return _pattern_as(pattern[np.abs(pattern['el'] - el) < 1e-3], return_format)
+
+    def simulate_grid(
+        self,
+        model: AntennaModel,
+        freq_mhz: float,
+        height_m: float,
+        ground: str = "average",
+        el_step: float = 5.0,
+        az_step: float = 5.0,
+    ) -> Dict[str, Any]:
+        """
+        Simulate the full upper-hemisphere pattern (elevation 0-90 deg x azimuth 0-360 deg)
+        in a single pymininec run. Returns dict with 'impedance', 1-D 'el' and 'az' axes, and
+        'gain' as an (len(el), len(az)) array, so gain[i, j] is at el[i], az[j]; each row
+        matches simulate_azimuth_pattern at that elevation. Steps are rounded like
+        simulate_pattern's.
+        """
+        n_el = self._step_count(el_step, 180.0)
+        n_az = self._step_count(az_step, 360.0)
+        el_step = 180.0 / n_el
+        az_step = 360.0 / n_az
+        n_theta = n_el // 2 + 1
+        n_phi = n_az + 1
+        result = _run_pymininec(
+            model=model,
+            freq_mhz=freq_mhz,
+            height_m=height_m,
+            ground_opts=get_ground_opts(ground),
+            pattern_opts={'theta': f'0,{el_step},{n_theta}', 'phi': f'0,{az_step},{n_phi}'},
+            option='far-field',
+        )
+        rows = result['pattern']
+        if len(rows) != n_theta * n_phi:
+            raise RuntimeError(f"pymininec returned {len(rows)} pattern rows, expected {n_theta * n_phi}")
+        # pymininec steps theta fastest within each phi; as (phi, theta) the table is a plain
+        # reshape, and the transposed view flips zenith order into ascending elevation
+        gain = rows['gain'].reshape(n_phi, n_theta).T[::-1]
+        return {
+            'impedance': result['impedance'],
+            'el': rows['el'][:n_theta][::-1].copy(),
+            'az': rows['az'][::n_theta].copy(),
+            'gain': np.ascontiguousarray(gain),
+        }
 
 # Standard ground types for pymininec
 # Values from NEC/ARRL conventions:
@@ -356,62 +1177,77 @@ class AntennaSimulator:
 #   'average': εr=13,  σ=0.005 S/m
 #   'good':    εr=20,  σ=0.03 S/m
 #   'free':    free space (no ground)
-def get_ground_opts(ground_type: str = "average") -> Optional[list]:
+# pymininec --medium args per ground type (None = free space). Tuples, so the shared
+# values returned by get_ground_opts can't be modified by a caller.
+_GROUND_OPTS: Dict[str, Optional[Tuple[str, ...]]] = {
+    "free": None,
+    "poor": ("--medium=5,0.001,0",),
+    "average": ("--medium=13,0.005,0",),
+    "good": ("--medium=20,0.03,0",),
+}
+
+def get_ground_opts(ground_type: str = "average") -> Optional[Tuple[str, ...]]:
     """
     Return pymininec ground options for a given ground type.
     ground_type: 'free', 'poor', 'average', 'good'
-    Returns a list of CLI args for pymininec, or None for free space.
+    Returns a tuple of CLI args for pymininec, or None for free space.
     """
-    ground_type = ground_type.lower()
-    if ground_type == "free":
-        return None
-    elif ground_type == "poor":
-        return ["--medium=5,0.001,0"]
-    elif ground_type == "average":
-        return ["--medium=13,0.005,0"]
-    elif ground_type == "good":
-        return ["--medium=20,0.03,0"]
-    else:
-        raise ValueError(f"Unknown ground type: {ground_type}")
+    try:
+        return _GROUND_OPTS[ground_type.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown ground type: {ground_type.lower()}") from None
 
 # === High-level utilities for antenna analysis and plotting ===
 
+def _cached_pattern(sim: AntennaSimulator, key: Tuple, compute) -> Any:
+    # Per-height results of compute_elevation_patterns / compute_azimuth_patterns, held on the
+    # simulator and keyed by model.fingerprint() and every argument, so repeated sweeps (e.g.
+    # a single comparison height after a full height sweep) are served without re-simulating.
+    # Treat returned patterns as read-only.
+    cache = sim._pattern_cache
+    if key in cache:
+        cache.move_to_end(key)
+        return cache[key]
+    cache[key] = result = compute()
+    while len(cache) > _PATTERN_CACHE_SIZE:
+        cache.popitem(last=False)
+    return result
+
+
 def compute_impedance_vs_heights(
     sim: AntennaSimulator,
     model: AntennaModel,
     freq_mhz: float,
     heights: List[float],
     ground: str,
-    el_step: float = 45.0,
-    az_step: float = 360.0,
+    el_step: Optional[float] = None,
+    az_step: Optional[float] = None,
+    max_workers: Optional[int] = None,
 ) -> List[Tuple[float, float, float]]:
     """
     Compute feedpoint impedance (R, X) for each height in meters.
-    Returns a list of tuples (height, R, X).
+    Returns a list of tuples (height, R, X). Heights are solved concurrently, up to
+    max_workers (default: ANTENNA_MAX_WORKERS, else one per CPU) at a time.
+    el_step and az_step are deprecated: no far field is computed, so they are ignored.
     """
-    results: List[Tuple[float, float, float]] = []
-    for h in heights:
-        res = AntennaSimulator().simulate_pattern(
-            model,
-            freq_mhz=freq_mhz,
-            height_m=h,
-            ground=ground,
-            el_step=el_step,
-            az_step=az_step,
-        )
-        R, X = res['impedance']
-        results.append((h, R, X))
-    return results
+    if el_step is not None or az_step is not None:
+        warnings.warn("compute_impedance_vs_heights no longer computes a pattern; el_step and "
+                      "az_step are ignored and will be removed", DeprecationWarning, stacklevel=2)
+    runs = [sim._impedance_run(model, freq_mhz, h, ground) for h in heights]
+    # Launch every height's solver run together, then read each back from the run cache
+    sim._prefetch(runs, max_workers)
+    return [(h, *_run_pymininec(**run)['impedance']) for h, run in zip(heights, runs)]
 
 
 def print_impedance_table(imp_list: List[Tuple[float, float, float]]) -> None:
     """
     Print a table of feedpoint impedance vs. height.
     """
-    print("Height (m) |    R (Ω)   |   X (Ω)")
-    print("-----------------------------------")
-    for h, R, X in imp_list:
-        print(f"   {h:6.1f} | {R:9.2f} | {X:8.2f}")
+    header = "Height (m) |    R (Ω)   |   X (Ω)\n-----------------------------------"
+    values = np.asarray(imp_list, dtype=np.float64).reshape(-1, 3)
+    # Every row in a single %-format over the flat (N, 3) values, and one write for the table
+    rows = ("\n   %6.1f | %9.2f | %8.2f" * len(values)) % tuple(values.ravel().tolist())
+    print(header + rows)
 
 
 def compute_elevation_patterns(
@@ -422,23 +1258,33 @@ def compute_elevation_patterns(
     ground: str,
     el_step: float = 1.0,
     az_step: float = 360.0,
-) -> Dict[float, List[Dict[str, float]]]:
+    return_format: str = 'dicts',
+    max_workers: Optional[int] = None,
+) -> Dict[float, Any]:
     """
     Compute elevation patterns (pattern at az=0) for each height.
-    Returns a dict mapping height to list of {{'el', 'az', 'gain'}}.
+    Returns a dict mapping height to list of {{'el', 'az', 'gain'}}
+    (or to a PATTERN_DTYPE array / dict of arrays for return_format='structured' / 'soa').
+    Heights are solved concurrently, up to max_workers (default: ANTENNA_MAX_WORKERS, else one
+    per CPU) at a time.
     """
-    patterns: Dict[float, List[Dict[str, float]]] = {}
-    for h in heights:
-        res = AntennaSimulator().simulate_pattern(
+    model_key = model.fingerprint()
+    def key(h: float) -> Tuple:
+        return ('elevation', model_key, freq_mhz, h, ground, el_step, az_step, return_format)
+    def run(h: float) -> Any:
+        return _cached_pattern(sim, key(h), lambda: sim.simulate_pattern(
             model,
             freq_mhz=freq_mhz,
             height_m=h,
             ground=ground,
             el_step=el_step,
             az_step=az_step,
-        )
-        patterns[h] = res['pattern']
-    return patterns
+            return_format=return_format,
+        )['pattern'])
+    # Heights still in the pattern cache need no solve, even if their run was evicted
+    sim._prefetch([sim._pattern_run(model, freq_mhz, h, ground, el_step, az_step)
+                   for h in heights if key(h) not in sim._pattern_cache], max_workers)
+    return {h: run(h) for h in heights}
 
 
 def compute_azimuth_patterns(
@@ -449,22 +1295,96 @@ def compute_azimuth_patterns(
     ground: str,
     el: float,
     az_step: float = 5.0,
-) -> Dict[float, List[Dict[str, float]]]:
+    return_format: str = 'dicts',
+    max_workers: Optional[int] = None,
+) -> Dict[float, Any]:
     """
     Compute azimuth patterns at fixed elevation for each height.
-    Returns a dict mapping height to list of {{'el', 'az', 'gain'}}.
+    Returns a dict mapping height to list of {{'el', 'az', 'gain'}}
+    (or to a PATTERN_DTYPE array / dict of arrays for return_format='structured' / 'soa').
+    Heights are solved concurrently, up to max_workers (default: ANTENNA_MAX_WORKERS, else one
+    per CPU) at a time.
     """
-    patterns: Dict[float, List[Dict[str, float]]] = {}
-    for h in heights:
-        patterns[h] = AntennaSimulator().simulate_azimuth_pattern(
+    model_key = model.fingerprint()
+    def key(h: float) -> Tuple:
+        return ('azimuth', model_key, freq_mhz, h, ground, el, az_step, return_format)
+    def run(h: float) -> Any:
+        return _cached_pattern(sim, key(h), lambda: sim.simulate_azimuth_pattern(
             model,
             freq_mhz=freq_mhz,
             height_m=h,
             ground=ground,
             el=el,
             az_step=az_step,
-        )
-    return patterns
+            return_format=return_format,
+        ))
+    # Heights still in the pattern cache need no solve, even if their run was evicted
+    sim._prefetch([sim._azimuth_run(model, freq_mhz, h, ground, el, az_step)
+                   for h in heights if key(h) not in sim._pattern_cache], max_workers)
+    return {h: run(h) for h in heights}
+
+
+def gain_by_angle(pattern: PatternLike, key: str = 'az') -> Dict[float, float]:
+    """
+    Index a pattern (any return_format) by angle for O(1) gain lookups.
+    Returns a dict mapping round(p[key], 3) to gain; the first entry wins on duplicates.
+    """
+    gains: Dict[float, float] = {}
+    if _is_columnar(pattern):
+        for angle, g in zip(pattern[key].tolist(), pattern['gain'].tolist()):
+            gains.setdefault(round(angle, 3), g)
+        return gains
+    for p in pattern:
+        gains.setdefault(round(p[key], 3), p['gain'])
+    return gains
+
+
+def max_gain(*patterns: PatternLike) -> float:
+    """
+    Peak gain across one or more patterns (lists of dicts, structured arrays or 'soa' dicts).
+    Each pattern is reduced with ndarray.max(); arrays are reduced in place without copying.
+    """
+    peaks = [
+        pat['gain'].max() if _is_columnar(pat)
+        else np.fromiter((p['gain'] for p in pat), dtype=np.float64, count=len(pat)).max()
+        for pat in patterns if _pattern_len(pat)
+    ]
+    return float(max(peaks))
+
+
+def forward_back_gain(az_pattern: PatternLike) -> Tuple[float, float]:
+    """
+    Return (gain at az=0, gain at az=180) from an azimuth cut (any return_format) in a
+    single pass.
+    """
+    if _is_columnar(az_pattern):
+        fwd_idx = np.flatnonzero(np.abs(az_pattern['az']) < 1e-6)
+        back_idx = np.flatnonzero(np.abs(az_pattern['az'] - 180.0) < 1e-6)
+        if fwd_idx.size == 0 or back_idx.size == 0:
+            raise ValueError("azimuth pattern has no az=0/180 samples")
+        return float(az_pattern['gain'][fwd_idx[0]]), float(az_pattern['gain'][back_idx[0]])
+    fwd = back = None
+    for p in az_pattern:
+        if fwd is None and abs(p['az']) < 1e-6:
+            fwd = p['gain']
+        elif back is None and abs(p['az'] - 180.0) < 1e-6:
+            back = p['gain']
+        if fwd is not None and back is not None:
+            return fwd, back
+    raise ValueError("azimuth pattern has no az=0/180 samples")
+
+
+def _closest_indices(values: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    # Index of the value closest to each target, first one on ties (as argmin). Sorted values
+    # (simulate_pattern's elevation cuts) take a binary search instead of a targets x values
+    # distance matrix.
+    if len(values) < 2 or np.any(values[1:] < values[:-1]):
+        return np.abs(values[None, :] - targets[:, None]).argmin(axis=1)
+    right = np.clip(np.searchsorted(values, targets, side='left'), 1, len(values) - 1)
+    left = right - 1
+    # Equal distances go to the lower neighbour; then step back to the first of any repeats
+    pick = np.where(np.abs(targets - values[left]) <= np.abs(values[right] - targets), left, right)
+    return np.searchsorted(values, values[pick], side='left')
 
 
 def print_gain_table(
@@ -478,26 +1398,40 @@ def print_gain_table(
     Highlight the maximum gain elevation for each height if highlight=True.
     """
     header = "Elevation (deg) |" + "".join([f" {h:>7} m" for h in heights])
-    print(header)
-    print("----------------|" + "-------" * len(heights))
+    lines = [header, "----------------|" + "-------" * len(heights)]
+    # One column of table values per height: the gain at the closest sampled elevation for
+    # every requested angle, resolved in one vectorised lookup. The first extreme wins,
+    # as max()/min() did.
+    targets = np.asarray(el_angles, dtype=np.float64)
+    table: Dict[float, List[float]] = {}
     max_el: Dict[float, float] = {}
-    if highlight:
-        for h in heights:
-            best = max(patterns[h], key=lambda p: p['gain'])
-            max_el[h] = best['el']
-    for el in el_angles:
+    for h in heights:
+        pattern = patterns[h]
+        if _is_columnar(pattern):
+            els, gains = np.asarray(pattern['el'], dtype=np.float64), np.asarray(pattern['gain'])
+        else:
+            els = np.fromiter((p['el'] for p in pattern), dtype=np.float64, count=len(pattern))
+            gains = np.fromiter((p['gain'] for p in pattern), dtype=np.float64, count=len(pattern))
+        table[h] = gains[_closest_indices(els, targets)].tolist()
+        if highlight:
+            max_el[h] = els[np.argmax(gains)]
+    for i, el in enumerate(el_angles):
         row = f"{el:8d}         |"
         for h in heights:
-            closest = min(patterns[h], key=lambda p: abs(p['el'] - el))
-            g = closest['gain']
+            g = table[h][i]
             if highlight and abs(max_el.get(h, -1) - el) < 1e-6:
                 row += f" \033[1;33m{g:7.3f}\033[0m"
             else:
                 row += f" {g:7.3f}"
-        print(row)
+        lines.append(row)
+    # One write for the whole table rather than one per row
+    print("\n".join(lines))
+
+# 0.89 ** ((MG - gain) / 2) written as exp(LOG089_HALF * (MG - gain)) for array input
+LOG089_HALF = math.log(0.89) / 2.0
 
 def configure_polar_axes(
-    ax: plt.Axes,
+    ax: 'plt.Axes',
     title: str,
     max_gain: float,
     rel_db: List[int] = None,
@@ -512,7 +1446,7 @@ def configure_polar_axes(
         rel_db = [0, 3, 6, 10, 20, 30, 40]
     # radial grid positions in linear amplitude (original 0.89-based scale)
     # 0.89^(d/2) maps approximately to -d dB ticks
-    r_ticks = [0.89 ** (d / 2.0) for d in rel_db]
+    r_ticks = np.exp(LOG089_HALF * np.asarray(rel_db, dtype=np.float64))
     labels = ['0 dB'] + [f'-{d} dB' for d in rel_db[1:]]
     ax.set_theta_zero_location(zero_loc)
     ax.set_theta_direction(direction)
@@ -523,6 +1457,90 @@ def configure_polar_axes(
     ax.set_thetagrids(np.arange(0, 360, 30))
     ax.grid(True)
 
+# Plot-only angle/gain/radius arrays are single precision: ~1e-7 relative error is far
+# below what a polar plot can show. Impedance and table values stay float64.
+PLOT_DTYPE = np.float32
+
+
+def polar_coords(
+    pattern: List[Dict[str, float]],
+    key: str,
+    max_gain: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return (angle_rad, r) arrays for a pattern sorted by key ('el' or 'az').
+    r is the 0.89-based amplitude ratio relative to max_gain used by the polar plots.
+    """
+    angles, gains = _sorted_angle_gain(pattern, key)
+    return angles, _polar_radius(gains, max_gain)
+
+
+# LOG089_HALF in the plotting dtype, so radius math never upcasts
+_LOG089_HALF_PLOT = PLOT_DTYPE(LOG089_HALF)
+
+def _polar_radius(gains: np.ndarray, max_gain: float) -> np.ndarray:
+    # exp(LOG089_HALF * (max_gain - gains)) evaluated in one new PLOT_DTYPE buffer
+    r = PLOT_DTYPE(max_gain) - gains
+    r *= _LOG089_HALF_PLOT
+    return np.exp(r, out=r)
+
+
+def _angle_order(angles: np.ndarray) -> Any:
+    # Stable sort order for angles, or a plain slice when they already ascend: patterns
+    # leave the simulator sorted (elevation cuts by el, azimuth cuts by az), so the usual
+    # case costs one comparison pass and no gather
+    if np.all(angles[1:] >= angles[:-1]):
+        return slice(None)
+    return np.argsort(angles, kind='stable')
+
+
+def _sorted_angle_gain(
+    pattern: List[Dict[str, float]],
+    key: str,
+    grids: Optional[Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]]] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    # (angle_rad, gain) arrays ordered by angle; stable so ties keep pattern order like sorted().
+    # With a grids dict, the sort order and radians of the last grid seen per key are reused
+    # when the next pattern was sampled on the same angles.
+    if _is_columnar(pattern):
+        angles, gains = pattern[key].astype(PLOT_DTYPE), pattern['gain'].astype(PLOT_DTYPE)
+    else:
+        n = len(pattern)
+        angles = np.fromiter((p[key] for p in pattern), dtype=PLOT_DTYPE, count=n)
+        gains = np.fromiter((p['gain'] for p in pattern), dtype=PLOT_DTYPE, count=n)
+    grid = grids.get(key) if grids is not None else None
+    if grid is not None and np.array_equal(grid[0], angles):
+        _, order, theta = grid
+    else:
+        order = _angle_order(angles)
+        theta = np.radians(angles[order])
+        if grids is not None:
+            grids[key] = (angles, order, theta)
+    return theta, gains[order]
+
+
+def polar_coords_shared(
+    patterns: List[List[Dict[str, float]]],
+    key: str,
+    max_gain: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    polar_coords for several patterns sampled on the same angle grid.
+    The angles are sorted and converted once; returns (angle_rad, r) with r shaped (len(patterns), n).
+    """
+    n = _pattern_len(patterns[0])
+    if any(_pattern_len(pat) != n for pat in patterns):
+        raise ValueError("patterns must share the same angle grid")
+    if all(_is_columnar(pat) for pat in patterns):
+        angles = patterns[0][key].astype(PLOT_DTYPE)
+        gains = np.stack([pat['gain'] for pat in patterns]).astype(PLOT_DTYPE)
+    else:
+        angles = np.fromiter((p[key] for p in patterns[0]), dtype=PLOT_DTYPE, count=n)
+        gains = np.array([[p['gain'] for p in pat] for pat in patterns], dtype=PLOT_DTYPE)
+    order = _angle_order(angles)
+    return np.radians(angles[order]), _polar_radius(gains[:, order], max_gain)
+
+
 def plot_polar_patterns(
     elevation_patterns: Dict[float, List[Dict[str, float]]],
     azimuth_patterns: Dict[float, List[Dict[str, float]]],
@@ -536,36 +1554,61 @@ def plot_polar_patterns(
     Generate elevation (az=0) and azimuth (el=el_fixed) polar plots for each height.
     Saves to output_file or displays if show_gui=True.
     """
+    curves = (
+        (legend_labels[idx] if legend_labels is not None else f"h={h}m",
+         elevation_patterns[h], azimuth_patterns[h])
+        for idx, h in enumerate(heights)
+    )
+    plot_polar_pattern_stream(curves, el_fixed, output_file, show_gui)
+
+
+def plot_polar_pattern_stream(
+    curves,
+    el_fixed: float,
+    output_file: str,
+    show_gui: bool = False,
+) -> None:
+    """
+    Like plot_polar_patterns, but consumes an iterable of (label, elevation_pattern, azimuth_pattern).
+    Each curve is reduced to angle/gain arrays as it arrives, so a generator can simulate and
+    plot one case at a time; radii are normalised once the shared maximum gain is known.
+    """
+    import matplotlib.pyplot as plt
     fig, (ax_el, ax_az) = plt.subplots(1, 2, subplot_kw={'polar': True}, figsize=(14, 7))
     colors = plt.rcParams['axes.prop_cycle'].by_key()['color']
-    # Elevation pattern
-    # Determine maximum gain (MG) for normalization
-    raw_max = max(max(p['gain'] for p in elevation_patterns[h]) for h in heights)
-    configure_polar_axes(ax_el, 'Elevation Pattern (az=0)', raw_max)
-    for idx, h in enumerate(heights):
-        data = sorted(elevation_patterns[h], key=lambda p: p['el'])
-        theta = np.radians([p['el'] for p in data])
-        # amplitude ratio relative to max gain (original 0.89-based scaling: 0.89^((MG - gain)/2))
-        r = [0.89 ** ((raw_max - p['gain']) / 2.0) for p in data]
-        label = legend_labels[idx] if legend_labels is not None else f"h={h}m"
-        ax_el.plot(theta, r, label=label, color=colors[idx % len(colors)])
+    labels: List[str] = []
+    curves_by_key: Dict[str, List[Tuple[np.ndarray, np.ndarray]]] = {'el': [], 'az': []}
+    raw_max = {'el': -np.inf, 'az': -np.inf}
+    # Curves are normally sampled on one elevation and one azimuth grid; convert each once
+    grids: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+    for label, elev_pat, az_pat in curves:
+        labels.append(label)
+        for key, pat in (('el', elev_pat), ('az', az_pat)):
+            angles, gains = _sorted_angle_gain(pat, key, grids)
+            curves_by_key[key].append((angles, gains))
+            raw_max[key] = max(raw_max[key], float(gains.max()))
+    # Radii need the overall maximum gain, so drawing waits until every curve is in
+    for key, ax in (('el', ax_el), ('az', ax_az)):
+        pairs = curves_by_key[key]
+        if pairs and all(angles is pairs[0][0] for angles, _ in pairs):
+            # Shared grid (the same theta array from grids): one plot call draws every curve
+            r = _polar_radius(np.stack([gains for _, gains in pairs]), raw_max[key])
+            lines = ax.plot(pairs[0][0], r.T)
+        else:
+            lines = [ax.plot(angles, _polar_radius(gains, raw_max[key]))[0] for angles, gains in pairs]
+        for idx, line in enumerate(lines):
+            line.set_label(labels[idx])
+            line.set_color(colors[idx % len(colors)])
+    configure_polar_axes(ax_el, 'Elevation Pattern (az=0)', raw_max['el'])
     ax_el.legend(loc='upper right', bbox_to_anchor=(1.2, 1.1))
-    # Azimuth pattern
-    # Determine max gain for azimuth
-    raw_max_az = max(max(p['gain'] for p in azimuth_patterns[h]) for h in heights)
-    configure_polar_axes(ax_az, f'Azimuth Pattern (el={int(el_fixed)}°)', raw_max_az, zero_loc='E', direction=-1)
-    for idx, h in enumerate(heights):
-        data = sorted(azimuth_patterns[h], key=lambda p: p['az'])
-        phi = np.radians([p['az'] for p in data])
-        r = [0.89 ** ((raw_max_az - p['gain']) / 2.0) for p in data]
-        label = legend_labels[idx] if legend_labels is not None else f"h={h}m"
-        ax_az.plot(phi, r, label=label, color=colors[idx % len(colors)])
+    configure_polar_axes(ax_az, f'Azimuth Pattern (el={int(el_fixed)}°)', raw_max['az'], zero_loc='E', direction=-1)
     ax_az.legend(loc='upper right', bbox_to_anchor=(1.2, 1.1))
     plt.tight_layout()
     if show_gui:
         plt.show()
     else:
-        plt.savefig(output_file)
+        fig.savefig(output_file)
+        plt.close(fig)
         print(f"Saved polar patterns to {output_file}")
 
 # === Report generation ===
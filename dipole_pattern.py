@@ -15,6 +15,7 @@ from antenna_model import (
     compute_elevation_patterns,
     compute_azimuth_patterns,
     plot_polar_patterns,
+    gain_by_angle,
     Report,
 )
 import os
@@ -42,15 +43,16 @@ def main():
     report.add_table('Feedpoint Impedance vs Height', ['Height (m)', 'R (Ω)', 'X (Ω)'], imp_list, parameters="frequency = 14.1 MHz; dipole_length = resonant_dipole_length(14.1 MHz); segments = 21; radius = 0.001 m; ground = average; heights = [5, 10, 15, 20] m")
 
     # 2) Gain tables and pattern computation
-    el_pats = compute_elevation_patterns(sim, model, freq_mhz, heights, ground)
+    el_pats = compute_elevation_patterns(sim, model, freq_mhz, heights, ground, return_format='structured')
     el_angles = list(range(0, 181, 5))
     # Build and bolded gain table
     headers = ['Elevation (deg)'] + [f'{h:.1f} m' for h in heights]
     rows = []
+    el_gains = {h: gain_by_angle(el_pats[h], 'el') for h in heights}
     for el in el_angles:
         row = [el]
         for h in heights:
-            val = next((p['gain'] for p in el_pats[h] if abs(p['el'] - el) < 1e-6), '')
+            val = el_gains[h].get(el, '')
             row.append(val)
         rows.append(row)
     # Determine peaks per height column
@@ -74,7 +76,7 @@ def main():
 
     # 3) Azimuth patterns at fixed elevation 30°
     el_fixed = 30.0
-    az_pats = compute_azimuth_patterns(sim, model, freq_mhz, heights, ground, el=el_fixed)
+    az_pats = compute_azimuth_patterns(sim, model, freq_mhz, heights, ground, el=el_fixed, return_format='structured')
 
     # 4) Plot patterns
     output_file = os.path.join(report.report_dir, 'pattern_comparison_all_heights.png')
@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 from antenna_model import (
     build_dipole_model,
     AntennaSimulator,
@@ -8,6 +9,8 @@ from antenna_model import (
     meters_to_feet,
     AntennaModel,
     AntennaElement,
+    _run_pymininec,
+    compute_impedance_vs_heights,
 )
 import re
 import os
@@ -22,6 +25,9 @@ def test_resonant_dipole_length():
     arrl_length_ft = 468 / f
     arrl_length_m = feet_to_meters(arrl_length_ft)
     assert l == pytest.approx(arrl_length_m, rel=0.0001)  # should match exactly
+    # Sequences are converted elementwise
+    freqs = [3.5, 7.1, 14.1]
+    assert resonant_dipole_length(freqs).tolist() == [resonant_dipole_length(x) for x in freqs]
 
 def test_build_dipole_model():
     model = build_dipole_model(total_length=20.0, segments=21, radius=0.001)
@@ -44,6 +50,239 @@ def test_run_pymininec_runs():
     assert isinstance(out['pattern'], list)
     assert len(out['pattern']) > 0
 
+def test_simulate_many_preserves_task_order():
+    length = resonant_dipole_length(14.1)
+    model = build_dipole_model(total_length=length, segments=21, radius=0.001)
+    sim = AntennaSimulator()
+    tasks = [
+        dict(model=model, freq_mhz=14.1, height_m=h, ground_opts=get_ground_opts("average"),
+             pattern_opts={"theta": "0,45,3", "phi": "0,0,1"}, option="far-field")
+        for h in (5.0, 10.0)
+    ]
+    results = sim.simulate_many(tasks)
+    assert len(results) == 2
+    # Reference impedance at 10 m over average ground (see test_dipole_impedance_10m)
+    R, X = results[1]['impedance']
+    assert R == pytest.approx(68.74317, rel=0.01)
+    assert X == pytest.approx(-49.64125, rel=0.01)
+    assert results[0]['impedance'] != results[1]['impedance']
+
+def test_simulate_many_duplicate_runs_with_different_flags():
+    length = resonant_dipole_length(14.1)
+    model = build_dipole_model(total_length=length, segments=21, radius=0.001)
+    base = dict(model=model, freq_mhz=14.1, height_m=7.0, ground_opts=get_ground_opts("average"),
+                pattern_opts={"theta": "0,45,3", "phi": "0,0,1"}, option="far-field")
+    # Same command twice, asking for different parts, plus one other run so the pool is used
+    tasks = [dict(base, need_pattern=False), dict(base, need_impedance=False), dict(base, height_m=3.0)]
+    with AntennaSimulator() as sim:
+        results = sim.simulate_many(tasks)
+    direct = _run_pymininec(**base)
+    assert results[0]['impedance'] == direct['impedance']
+    assert results[1]['pattern'] is not None
+    assert list(results[1]['pattern']['gain']) == list(direct['pattern']['gain'])
+
+def test_simulate_many_pool_follows_max_workers():
+    length = resonant_dipole_length(14.1)
+    model = build_dipole_model(total_length=length, segments=21, radius=0.001)
+    def tasks(heights):
+        return [dict(model=model, freq_mhz=14.1, height_m=h, ground_opts=get_ground_opts("average"),
+                     pattern_opts={"theta": "0,45,3", "phi": "0,0,1"}, option="far-field", need_pattern=False)
+                for h in heights]
+    with AntennaSimulator() as sim:
+        sim.simulate_many(tasks((4.0, 6.0)), max_workers=2)
+        assert sim._pool._max_workers == 2
+        # A different size replaces the warm pool
+        sim.simulate_many(tasks((8.0, 12.0)), max_workers=3)
+        assert sim._pool._max_workers == 3
+
+def test_disk_cache_treats_unloadable_entries_as_misses(monkeypatch, tmp_path):
+    import antenna_model
+    monkeypatch.setenv("ANTENNA_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(antenna_model, "_PYMININEC_CACHE", antenna_model.OrderedDict())
+    model = build_dipole_model(total_length=resonant_dipole_length(14.1), segments=21, radius=0.001)
+    sim = AntennaSimulator()
+    expected = sim.simulate_impedance(model, freq_mhz=14.1, height_m=6.0, ground="average")
+    entries = list(tmp_path.glob("*/*.pkl"))
+    assert entries
+    for entry in entries:
+        # A pickle naming a module that no longer exists
+        entry.write_bytes(b"cno_such_module\nThing\n.")
+    antenna_model._PYMININEC_CACHE.clear()
+    assert sim.simulate_impedance(model, freq_mhz=14.1, height_m=6.0, ground="average") == expected
+
+def _inproc_then_cli(monkeypatch, solve):
+    # solve() in-process, then again through the pymininec CLI, each from an empty run cache
+    import antenna_model
+    if antenna_model._mininec is None or shutil.which("pymininec") is None:
+        pytest.skip("needs both the mininec package and the pymininec CLI")
+    monkeypatch.delenv("ANTENNA_CACHE_DIR", raising=False)
+    monkeypatch.setattr(antenna_model, "_PYMININEC_CACHE", antenna_model.OrderedDict())
+    inproc = solve()
+    antenna_model._PYMININEC_CACHE.clear()
+    monkeypatch.setattr(antenna_model, "_mininec", None)
+    return inproc, solve()
+
+@pytest.mark.parametrize("need_impedance", [True, False])
+@pytest.mark.parametrize("need_pattern", [True, False])
+@pytest.mark.parametrize("keep_raw", [True, False])
+def test_cli_stream_parse_matches_inprocess(monkeypatch, need_impedance, need_pattern, keep_raw):
+    model = build_dipole_model(total_length=resonant_dipole_length(14.1), segments=21, radius=0.001)
+    run = AntennaSimulator()._pattern_run(model, 14.1, 10.0, "average", 10.0, 10.0)
+    flags = dict(need_impedance=need_impedance, need_pattern=need_pattern, keep_raw=keep_raw)
+    inproc, cli = _inproc_then_cli(monkeypatch, lambda: _run_pymininec(**run, **flags))
+    assert cli['impedance'] == inproc['impedance']
+    assert (cli['impedance'] is not None) == need_impedance
+    if need_pattern:
+        assert np.array_equal(cli['pattern'], inproc['pattern'])
+    else:
+        assert cli['pattern'] is None
+    assert cli['raw_output'] == inproc['raw_output']
+
+def test_cli_simulate_calls_match_inprocess(monkeypatch):
+    import antenna_model
+    model = build_dipole_model(total_length=resonant_dipole_length(14.1), segments=21, radius=0.001)
+
+    def solve():
+        sim = AntennaSimulator()
+        return (
+            sim.simulate_pattern(model, 14.1, 10.0, "average", el_step=5, return_format='structured'),
+            sim.simulate_azimuth_pattern(model, 14.1, 10.0, "average", el=30, az_step=5,
+                                         return_format='structured'),
+            sim.simulate_impedance(model, 14.1, 10.0, "average"),
+            # 91 x 73 rows, more than one _StreamParser.CHUNK_ROWS block
+            sim.simulate_grid(model, 14.1, 10.0, "average", el_step=1, az_step=5),
+        )
+
+    (pat, az, imp, grid), (pat_cli, az_cli, imp_cli, grid_cli) = _inproc_then_cli(monkeypatch, solve)
+    assert pat_cli['impedance'] == pat['impedance']
+    assert np.array_equal(pat_cli['pattern'], pat['pattern'])
+    assert np.array_equal(az_cli, az)
+    assert imp_cli == imp
+    assert grid['gain'].size > antenna_model._StreamParser.CHUNK_ROWS
+    assert grid_cli['impedance'] == grid['impedance']
+    for k in ('el', 'az', 'gain'):
+        assert np.array_equal(grid_cli[k], grid[k])
+
+def test_cli_async_prefetch_matches_inprocess(monkeypatch):
+    # max_workers=1 keeps compute_elevation_patterns off the process pool, so CLI runs go
+    # through the asyncio subprocess path
+    from antenna_model import compute_elevation_patterns
+    model = build_dipole_model(total_length=resonant_dipole_length(14.1), segments=21, radius=0.001)
+    heights = [5.0, 10.0, 15.0]
+
+    def solve():
+        return compute_elevation_patterns(AntennaSimulator(), model, 14.1, heights, "average",
+                                          el_step=5, az_step=5, max_workers=1,
+                                          return_format='structured')
+
+    inproc, cli = _inproc_then_cli(monkeypatch, solve)
+    for h in heights:
+        assert np.array_equal(cli[h], inproc[h])
+
+def test_compute_patterns_skip_solves_held_in_pattern_cache(monkeypatch):
+    import antenna_model
+    from antenna_model import compute_elevation_patterns, compute_azimuth_patterns
+    if antenna_model._mininec is None:
+        pytest.skip("counts in-process solves")
+    monkeypatch.delenv("ANTENNA_CACHE_DIR", raising=False)
+    monkeypatch.setattr(antenna_model, "_PYMININEC_CACHE", antenna_model.OrderedDict())
+    model = build_dipole_model(total_length=resonant_dipole_length(14.1), segments=21, radius=0.001)
+    sim = AntennaSimulator()
+    heights = [5.0, 10.0]
+    first_el = compute_elevation_patterns(sim, model, 14.1, heights, "average", el_step=5, max_workers=1)
+    first_az = compute_azimuth_patterns(sim, model, 14.1, heights, "average", el=30, max_workers=1)
+    # Runs evicted from the run cache, patterns still memoised on the simulator
+    antenna_model._PYMININEC_CACHE.clear()
+    solves = []
+    real = antenna_model._run_pymininec_inproc
+    monkeypatch.setattr(antenna_model, "_run_pymininec_inproc",
+                        lambda *a, **k: solves.append(a) or real(*a, **k))
+    assert compute_elevation_patterns(sim, model, 14.1, heights, "average", el_step=5, max_workers=1) == first_el
+    assert compute_azimuth_patterns(sim, model, 14.1, heights, "average", el=30, max_workers=1) == first_az
+    assert solves == []
+
+def test_simulate_sweep_matches_direct_solves():
+    length = resonant_dipole_length(14.1)
+    model = build_dipole_model(total_length=length, segments=21, radius=0.001)
+    sim = AntennaSimulator()
+    freqs = [13.9 + 0.05 * i for i in range(12)]
+    sweep = sim.simulate_sweep(model, freqs, 10.0, ground="average", el_step=15, az_step=15, coarse_n=4)
+    assert [r['freq_mhz'] for r in sweep] == pytest.approx(freqs)
+    # Spline points between the coarse solves should track a direct solve closely
+    direct = sim.simulate_pattern(model, freqs[5], 10.0, ground="average", el_step=15, az_step=15)
+    assert sweep[5]['impedance'] == pytest.approx(direct['impedance'], abs=0.05)
+    assert [p['gain'] for p in sweep[5]['pattern']] == pytest.approx([p['gain'] for p in direct['pattern']], abs=0.05)
+
+def test_simulate_grid_rows_match_azimuth_cuts():
+    length = resonant_dipole_length(14.1)
+    model = build_dipole_model(total_length=length, segments=21, radius=0.001)
+    sim = AntennaSimulator()
+    grid = sim.simulate_grid(model, 14.1, 10.0, ground="average", el_step=30, az_step=45)
+    assert grid['gain'].shape == (len(grid['el']), len(grid['az']))
+    cut = sim.simulate_azimuth_pattern(model, 14.1, 10.0, "average", el=30.0, az_step=45)
+    row = list(grid['el']).index(30.0)
+    assert list(grid['gain'][row]) == pytest.approx([p['gain'] for p in cut])
+
+def test_is_symmetric_about_yz():
+    dipole = build_dipole_model(total_length=resonant_dipole_length(14.1), segments=21, radius=0.001)
+    assert dipole.is_symmetric_about_yz()
+    # A reflector behind the driven element breaks the x -> -x mirror symmetry
+    yagi = build_dipole_model(total_length=resonant_dipole_length(14.1), segments=21, radius=0.001)
+    yagi.add_element(AntennaElement(x1=-2.0, y1=-5.5, z1=0.0, x2=-2.0, y2=5.5, z2=0.0,
+                                    segments=21, radius=0.001))
+    assert not yagi.is_symmetric_about_yz()
+    assert not AntennaModel().is_symmetric_about_yz()
+
+@pytest.mark.parametrize("ground, height", [("average", 10.0), ("free", 0.0)])
+def test_symmetric_model_mirrors_az0_cut(monkeypatch, ground, height):
+    model = build_dipole_model(total_length=resonant_dipole_length(14.1), segments=21, radius=0.001)
+    sim = AntennaSimulator()
+    mirrored = sim.simulate_pattern(model, 14.1, height, ground, el_step=5, return_format='structured')
+    # Force the az=0 / az=180 two-half-cut run the symmetry check normally skips
+    monkeypatch.setattr(model, "is_symmetric_about_yz", lambda: False)
+    assert sim._pattern_run(model, 14.1, height, ground, 5, 5)['pattern_opts']['phi'] == "0,180,2"
+    both = sim.simulate_pattern(model, 14.1, height, ground, el_step=5, return_format='structured')
+    assert mirrored['impedance'] == both['impedance']
+    assert np.array_equal(mirrored['pattern'], both['pattern'])
+
+def test_simulate_pattern_el_max_90_is_first_half():
+    model = build_dipole_model(total_length=resonant_dipole_length(14.1), segments=21, radius=0.001)
+    model.add_element(AntennaElement(x1=-2.0, y1=-5.5, z1=0.0, x2=-2.0, y2=5.5, z2=0.0,
+                                     segments=21, radius=0.001))
+    sim = AntennaSimulator()
+    full = sim.simulate_pattern(model, 14.1, 10.0, "average", el_step=5, return_format='structured')
+    upper = sim.simulate_pattern(model, 14.1, 10.0, "average", el_step=5, el_max=90,
+                                 return_format='structured')
+    assert list(upper['pattern']['el']) == [5.0 * i for i in range(19)]
+    # The default cut's second half (from az=180) starts again at el=90
+    assert list(full['pattern']['el'][19:21]) == [90.0, 95.0]
+    assert np.array_equal(upper['pattern'], full['pattern'][:19])
+    assert upper['impedance'] == full['impedance']
+
+@pytest.mark.parametrize("return_format", ["dicts", "structured", "structured32", "soa"])
+def test_return_formats_hold_the_dicts_data(return_format):
+    model = build_dipole_model(total_length=resonant_dipole_length(14.1), segments=21, radius=0.001)
+    sim = AntennaSimulator()
+
+    def columns(pattern):
+        # (el, az, gain) columns of any return format, as float64 arrays
+        if isinstance(pattern, list):
+            return [np.array([p[k] for p in pattern]) for k in ('el', 'az', 'gain')]
+        return [np.asarray(pattern[k], dtype=np.float64) for k in ('el', 'az', 'gain')]
+
+    # float32 keeps about 7 significant digits
+    tol = dict(rel=1e-6, abs=1e-4) if return_format == 'structured32' else dict(rel=0, abs=0)
+    ref = sim.simulate_pattern(model, 14.1, 10.0, "average", el_step=5)
+    got = sim.simulate_pattern(model, 14.1, 10.0, "average", el_step=5, return_format=return_format)
+    assert got['impedance'] == ref['impedance']
+    for g, r in zip(columns(got['pattern']), columns(ref['pattern'])):
+        assert list(g) == pytest.approx(list(r), **tol)
+    ref_az = sim.simulate_azimuth_pattern(model, 14.1, 10.0, "average", el=30, az_step=10)
+    got_az = sim.simulate_azimuth_pattern(model, 14.1, 10.0, "average", el=30, az_step=10,
+                                          return_format=return_format)
+    for g, r in zip(columns(got_az), columns(ref_az)):
+        assert list(g) == pytest.approx(list(r), **tol)
+
 def test_dipole_pattern_regression():
     """
     Check gain at multiple (el, az) points for a dipole in free space (height=0).
@@ -103,6 +342,12 @@ def test_dipole_impedance_10m():
         if ground == "average":
             assert R == pytest.approx(expected[0], rel=0.01), f"R at 10m: got {R}, expected {expected[0]}"
             assert X == pytest.approx(expected[1], rel=0.01), f"X at 10m: got {X}, expected {expected[1]}"
+        # The impedance-only path skips the far field but solves the same system
+        assert sim.simulate_impedance(model, freq_mhz=freq, height_m=height, ground=ground) == (R, X)
+        # The pattern step arguments are ignored, and passing them is deprecated
+        with pytest.warns(DeprecationWarning):
+            imp = compute_impedance_vs_heights(sim, model, freq, [height], ground, el_step=45, az_step=360)
+        assert imp == [(height, R, X)]
 
 class TestAntennaModel:
     def test_broadside_dipole_phased_symmetry(self):